@@ -10,21 +10,24 @@ import sys
 import os
 
 # Check Python version early (must be before other imports)
-if sys.version_info < (3, 6):
-    print("Error: Python 3.6 or higher is required")
+if sys.version_info < (3, 7):
+    print("Error: Python 3.7 or higher is required")
     print(f"Current version: Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
     print("\nPlease upgrade Python:")
     print("  sudo apt install python3")
     sys.exit(1)
-import re
-import subprocess
-import argparse
-import shutil
-import tempfile
+import json
+import hashlib
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from configparser import ConfigParser
-from datetime import datetime
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # subprocess is imported where it is used; it is only needed up front
+    # for annotations
+    import subprocess
 
 # Quickstrap framework version. Kept in lock-step with the git tag on GitHub
 # (tag `v<VERSION>`), so a project can tell exactly which engine it carries.
@@ -32,6 +35,12 @@ from typing import List, Tuple, Dict, Optional
 # changes - not by the projects that embed it.
 QUICKSTRAP_VERSION = "1.0.0"
 
+# Format of the parse results cached in ~/.cache/quickstrap. Bump it whenever
+# the profile or dpkg parsing changes; cached entries also record the framework
+# version, so --update-framework invalidates them as well.
+CACHE_FORMAT = 2
+_CACHE_VERSION = f"{QUICKSTRAP_VERSION}/{CACHE_FORMAT}"
+
 # Default upstream for `--update-framework`. Override with `--source` (a local
 # checkout or an alternate git URL).
 QUICKSTRAP_REPO = "https://github.com/Stefan-Schmidbauer/quickstrap.git"
@@ -49,6 +58,23 @@ FRAMEWORK_FILES = [
 # project's own README. (upstream_path, local_path)
 FRAMEWORK_README = ("README.md", "README.quickstrap.md")
 
+# Normalized platform name and the suffix of platform-specific config keys
+# (e.g. 'start_command_linux'). Quickstrap is Linux-only, so these are fixed.
+PLATFORM = 'linux'
+PLATFORM_SUFFIX = '_' + PLATFORM
+# Suffixes of keys for other platforms; dropped when profiles are read
+OTHER_PLATFORM_SUFFIXES = ('_windows',)
+# Platform-specific names of the keys that can be set per platform
+PLATFORM_KEYS = {
+    key: key + PLATFORM_SUFFIX
+    for key in ('python_requirements', 'system_requirements', 'pre_install_scripts',
+                'post_install_scripts', 'uninstall_scripts', 'start_command')
+}
+
+# dpkg's package database. Its mtime changes whenever a package is installed
+# or removed, so it keys the on-disk cache of installed package names.
+DPKG_STATUS_FILE = '/var/lib/dpkg/status'
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -62,31 +88,58 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Static prefixes/suffix of the print_* helpers, built once.
+#
+# The helpers write to stdout without forcing a flush: main() turns off line
+# buffering, so messages are collected and written in batches. Output is
+# flushed at phase boundaries (print_header), before blocking work
+# (subprocesses) and by input() before each prompt.
+_PRE_HEADER = Colors.BOLD + Colors.HEADER
+_PRE_OK = Colors.OKGREEN + '[OK] '
+_PRE_ERR = Colors.FAIL + '[X] '
+_PRE_WARN = Colors.WARNING + '[!] '
+_PRE_INFO = Colors.OKCYAN + '[i] '
+_END = Colors.ENDC + '\n'
+_HEADER_RULE = _PRE_HEADER + '=' * 70 + Colors.ENDC
+
+
 def print_header(text: str):
     """Print a formatted header"""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'=' * 70}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{text:^70}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'=' * 70}{Colors.ENDC}\n")
+    sys.stdout.write('\n' + _HEADER_RULE + '\n' + _PRE_HEADER + format(text, '^70') + _END
+                     + _HEADER_RULE + '\n\n')
+    sys.stdout.flush()
 
 
 def print_success(text: str):
     """Print success message"""
-    print(f"{Colors.OKGREEN}[OK] {text}{Colors.ENDC}")
+    sys.stdout.write(_PRE_OK + text + _END)
 
 
 def print_error(text: str):
     """Print error message"""
-    print(f"{Colors.FAIL}[X] {text}{Colors.ENDC}")
+    sys.stdout.write(_PRE_ERR + text + _END)
 
 
 def print_warning(text: str):
     """Print warning message"""
-    print(f"{Colors.WARNING}[!] {text}{Colors.ENDC}")
+    sys.stdout.write(_PRE_WARN + text + _END)
 
 
 def print_info(text: str):
     """Print info message"""
-    print(f"{Colors.OKCYAN}[i] {text}{Colors.ENDC}")
+    sys.stdout.write(_PRE_INFO + text + _END)
+
+
+def print_items(items, prefix: str = "  - "):
+    """Print one line per item with a single write.
+
+    Args:
+        items: Iterable of items (converted with str)
+        prefix: Text written before each item
+    """
+    lines = "".join(f"{prefix}{item}\n" for item in items)
+    if lines:
+        sys.stdout.write(lines)
 
 
 def get_venv_paths(venv_path: Path) -> Tuple[Path, Path]:
@@ -103,6 +156,61 @@ def get_venv_paths(venv_path: Path) -> Tuple[Path, Path]:
     return pip_exe, python_exe
 
 
+def _venv_valid(venv_path: Path) -> bool:
+    """Check that a venv contains working pip and python executables.
+
+    Reads the venv's bin directory once instead of probing each executable
+    separately. Symlinks are followed, so a venv whose python points to a
+    removed interpreter counts as invalid.
+
+    Args:
+        venv_path: Path to the virtual environment directory
+
+    Returns:
+        True if both executables are present
+    """
+    try:
+        with os.scandir(venv_path / 'bin') as entries:
+            names = {e.name for e in entries if e.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return {'pip', 'python'} <= names
+
+
+# Written into the venv after a successful creation; holds the Python
+# major.minor version the venv was built with.
+VENV_SENTINEL = '.quickstrap_ok'
+
+
+def _python_version_tag() -> str:
+    """Return the major.minor version of the running interpreter."""
+    return '%d.%d' % sys.version_info[:2]
+
+
+def _read_venv_sentinel(venv_path: Path) -> Optional[str]:
+    """Read the Python version recorded in the venv sentinel.
+
+    Args:
+        venv_path: Path to the virtual environment directory
+
+    Returns:
+        Recorded version string, or None if the sentinel is missing
+    """
+    try:
+        with open(venv_path / VENV_SENTINEL, encoding='utf-8') as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def _write_venv_sentinel(venv_path: Path) -> None:
+    """Record the current Python version in the venv sentinel."""
+    try:
+        (venv_path / VENV_SENTINEL).write_text(_python_version_tag() + '\n', encoding='utf-8')
+    except OSError:
+        pass
+
+
 def get_config_dir() -> Path:
     """Get project directory for configuration files.
 
@@ -122,7 +230,7 @@ def get_platform_name() -> str:
     Returns:
         'linux'
     """
-    return 'linux'
+    return PLATFORM
 
 
 def safe_app_name(app_name: str) -> str:
@@ -140,11 +248,37 @@ def safe_app_name(app_name: str) -> str:
     return app_name.lower().replace(' ', '_').replace('/', '_').replace('\\', '_')
 
 
+def resolve_platform_keys(config: Dict[str, str]) -> Dict[str, str]:
+    """Specialize a config section for the current platform.
+
+    Strips all values, stores each non-empty platform-specific value (e.g.
+    'start_command_linux') under its generic key ('start_command') and drops
+    the keys of other platforms. Done once when profiles are read, so that
+    resolve_platform_config is a single dict lookup.
+
+    Args:
+        config: Raw configuration dictionary (metadata or profile)
+
+    Returns:
+        New dict with platform-specific keys resolved
+    """
+    resolved = {}
+    for k, v in config.items():
+        if not k.endswith(OTHER_PLATFORM_SUFFIXES):
+            resolved[k] = v.strip()
+    for k, v in list(resolved.items()):
+        if k.endswith(PLATFORM_SUFFIX) and v:
+            resolved[k[:-len(PLATFORM_SUFFIX)]] = v
+    return resolved
+
+
 def resolve_platform_config(config: Dict, key: str, required: bool = False) -> Optional[str]:
     """Resolve platform-specific or generic config value.
 
-    Tries platform-specific key first (e.g., 'start_command_linux'),
-    then falls back to generic key (e.g., 'start_command').
+    The platform-specific key (e.g., 'start_command_linux') takes precedence
+    over the generic key (e.g., 'start_command'). Profiles and metadata
+    returned by read_profiles are already resolved (see
+    resolve_platform_keys), so this is a single lookup.
 
     Args:
         config: Configuration dictionary (metadata or profile)
@@ -154,17 +288,13 @@ def resolve_platform_config(config: Dict, key: str, required: bool = False) -> O
     Returns:
         Resolved value or None if not found
     """
-    # Try linux-specific key first
-    linux_key = f"{key}_linux"
-    if linux_key in config and config[linux_key].strip():
-        return config[linux_key].strip()
-
-    # Fall back to generic key
-    if key in config and config[key].strip():
-        return config[key].strip()
+    value = config.get(key)
+    if value:
+        return value
 
     # Not found
     if required:
+        linux_key = PLATFORM_KEYS.get(key) or key + PLATFORM_SUFFIX
         print_error(f"Required configuration key '{key}' not found (tried '{linux_key}' and '{key}')")
 
     return None
@@ -194,95 +324,421 @@ def validate_platform_support(metadata: Dict) -> bool:
     return True
 
 
-def read_profiles(profile_file: str = 'quickstrap/installation_profiles.ini') -> Tuple[Dict, Dict]:
-    """Read and parse installation profiles.
+@lru_cache(maxsize=None)
+def _dir_entries(directory: str) -> Optional[frozenset]:
+    """Memoized listing of a directory's entry names.
+
+    One os.scandir per directory answers the existence checks for all files
+    in it, instead of one stat per file.
+
+    Returns:
+        Frozenset of entry names (empty if the directory does not exist),
+        or None if the directory cannot be listed
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    """Memoized existence check for files referenced by the profile config.
+
+    Only use this for project files that the installer never creates or
+    removes (requirements files, scripts); the answer is cached for the
+    lifetime of the process. Looks the name up in the memoized listing of
+    its parent directory (see _dir_entries).
+    """
+    directory, name = os.path.split(os.path.normpath(path))
+    entries = _dir_entries(directory or '.')
+    if entries is None:
+        return os.path.exists(path)
+    return name in entries
+
+
+@lru_cache(maxsize=None)
+def _stat_path(path: str) -> Optional[os.stat_result]:
+    """Memoized stat of a file referenced by the profile config.
+
+    One stat answers both "does it exist" and "is it executable" (via the
+    mode bits), and scripts shared between profiles are only checked once.
+    The same caveat as for _path_exists applies.
+
+    Returns:
+        stat result, or None if the path does not exist
+    """
+    if not _path_exists(path):
+        return None
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_cache_dir() -> Path:
+    """Get the per-user cache directory for Quickstrap.
+
+    Honors XDG_CACHE_HOME and falls back to ~/.cache. Resolved once per run;
+    the home directory lookup may go through NSS.
+
+    Returns:
+        Path to the cache directory (may not exist yet)
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(cache_home) / 'quickstrap'
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Write a JSON cache file atomically, ignoring errors.
+
+    The data is written to a temp file and renamed into place, so a
+    concurrent run never sees a partial file. Caches are an optimization
+    only, so write failures are silently ignored.
+    """
+    import tempfile
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _parse_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse an INI file into a dict of sections.
+
+    A small reader for the subset of the INI format used by
+    installation_profiles.ini and the installation config, avoiding the
+    import and parse cost of configparser. Like ConfigParser's defaults it accepts '=' and ':' as
+    delimiters, lowercases keys, skips full-line '#' and ';' comments and
+    joins indented continuation lines into multi-line values. Interpolation
+    and the DEFAULT section are not supported.
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        Dict mapping section names to dicts of key/value pairs
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+    key = None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line or line[0] in '#;':
+                continue
+
+            # Indented line continues the previous value
+            if raw_line[0] in ' \t' and current is not None and key is not None:
+                current[key] = f"{current[key]}\n{line}" if current[key] else line
+                continue
+
+            if line[0] == '[' and line[-1] == ']':
+                current = sections.setdefault(line[1:-1].strip(), {})
+                key = None
+                continue
+
+            if current is None:
+                continue
+
+            # Split on whichever delimiter comes first
+            delimiters = [p for p in (line.find('='), line.find(':')) if p != -1]
+            if not delimiters:
+                continue
+            pos = min(delimiters)
+            key = line[:pos].strip().lower()
+            current[key] = line[pos + 1:].strip()
+
+    return sections
+
+
+def _parse_profiles_cached(profile_file: str, fingerprint: Tuple[int, int],
+                           use_cache: bool = True) -> Tuple[Dict, Dict]:
+    """Parse the profiles INI file, using an on-disk cache of the result.
+
+    The parsed dicts are cached in ~/.cache/quickstrap/, one file per
+    profile file path, keyed by the file's (mtime, size) fingerprint and
+    the cache version (see CACHE_FORMAT). The INI file is only parsed when
+    it or the parser changed since the last run.
+
+    Args:
+        profile_file: Path to installation_profiles.ini
+        fingerprint: (st_mtime_ns, st_size) of profile_file
+        use_cache: If False, ignore a cached result (it is still refreshed)
 
     Returns:
         Tuple of (profiles_dict, metadata_dict)
-        profiles_dict: Dict with profile names as keys and profile configs as values
-        metadata_dict: Dict with global metadata (app_name, config_dir, after_install, etc.)
     """
-    if not Path(profile_file).exists():
-        print_error(f"Profile configuration file not found: {profile_file}")
-        sys.exit(1)
+    abs_path = os.path.abspath(profile_file)
+    path_hash = hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:16]
+    cache_file = get_cache_dir() / f'profiles-{path_hash}.json'
+
+    if use_cache:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if (cached.get('version') == _CACHE_VERSION
+                    and cached.get('fingerprint') == list(fingerprint)):
+                return cached['profiles'], cached['metadata']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
 
-    config = ConfigParser()
-    config.read(profile_file, encoding='utf-8')
+    config = _parse_ini(profile_file)
 
     profiles = {}
-    for section in config.sections():
+    for section, values in config.items():
         if section.startswith('profile:'):
             profile_name = section.split(':', 1)[1]
-            profiles[profile_name] = dict(config[section])
+            profiles[profile_name] = values
 
     # Extract metadata
-    metadata = {}
-    if 'metadata' in config:
-        metadata = dict(config['metadata'])
+    metadata = config.get('metadata', {})
+
+    _write_json_atomic(cache_file, {
+        'version': _CACHE_VERSION,
+        'fingerprint': list(fingerprint),
+        'profiles': profiles,
+        'metadata': metadata,
+    })
+    return profiles, metadata
+
+
+# Profiles parsed by this process: path -> (fingerprint, profiles, metadata)
+_PROFILE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict, Dict]] = {}
+
 
+def read_profiles(profile_file: str = 'quickstrap/installation_profiles.ini',
+                  use_cache: bool = True) -> Tuple[Dict, Dict]:
+    """Read and parse installation profiles.
+
+    Results are cached in memory and on disk (see _parse_profiles_cached),
+    keyed by the file's (mtime, size) fingerprint, so the INI file is only
+    parsed again after it changed. The returned dicts are shared between
+    callers and must not be modified.
+
+    Args:
+        profile_file: Path to installation_profiles.ini
+        use_cache: If False, parse the file even if the on-disk cache is
+            current (used by --rebuild-venv to start from a clean slate)
+
+    Returns:
+        Tuple of (profiles_dict, metadata_dict)
+        profiles_dict: Dict with profile names as keys and profile configs as values
+        metadata_dict: Dict with global metadata (app_name, config_dir, after_install, etc.)
+    """
+    try:
+        st = os.stat(profile_file)
+    except OSError:
+        print_error(f"Profile configuration file not found: {profile_file}")
+        sys.exit(1)
+
+    fingerprint = (st.st_mtime_ns, st.st_size)
+    cached = _PROFILE_CACHE.get(profile_file)
+    if use_cache and cached and cached[0] == fingerprint:
+        return cached[1], cached[2]
+
+    profiles, metadata = _parse_profiles_cached(profile_file, fingerprint, use_cache)
+    profiles = {name: resolve_platform_keys(profile) for name, profile in profiles.items()}
+    metadata = resolve_platform_keys(metadata)
+    _PROFILE_CACHE[profile_file] = (fingerprint, profiles, metadata)
     return profiles, metadata
 
 
-def check_system_packages_linux(package_file: str) -> Tuple[List[str], List[str]]:
-    """Check which Linux system packages (APT/DEB) are installed.
+def get_installed_dpkg_packages() -> set:
+    """Get the names of all fully installed APT/DEB packages.
+
+    The status database is read directly (see _read_dpkg_status_file), with
+    dpkg-query as the fallback. The result is cached in
+    ~/.cache/quickstrap/dpkg_status.json, keyed by the mtime of the dpkg
+    status database and the cache version (see CACHE_FORMAT), so as long
+    as no package was installed or removed since the last run nothing is
+    parsed at all. The cache is bypassed while dpkg's journal has entries.
+
+    Returns:
+        Set of installed package names
+    """
+    import subprocess
 
-    Uses dpkg-query to check package status on Debian/Ubuntu systems.
+    cache_file = get_cache_dir() / 'dpkg_status.json'
+
+    # The status mtime only identifies the package state while the journal is
+    # empty; otherwise neither use nor write the cache
+    try:
+        mtime = None if _dpkg_journal_pending() else os.stat(DPKG_STATUS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == _CACHE_VERSION and cached.get('mtime') == mtime:
+                return set(cached['installed'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    installed_set = _read_dpkg_status_file()
+    if installed_set is not None:
+        if mtime is not None:
+            _write_json_atomic(cache_file, {
+                'version': _CACHE_VERSION,
+                'mtime': mtime,
+                'installed': sorted(installed_set),
+            })
+        return installed_set
+
+    # Query the whole database once; cheaper to cache than per-profile queries
+    # Parse the output line by line as it arrives instead of buffering it all
+    installed_set = set()
+    with subprocess.Popen(
+        ['dpkg-query', '-W', '-f=${Package}|${db:Status-Status}\n'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    ) as proc:
+        for line in proc.stdout:
+            name, _, status = line.rstrip(b'\n').partition(b'|')
+            if status == b'installed':
+                installed_set.add(name.decode())
+
+    if mtime is not None and proc.returncode == 0:
+        _write_json_atomic(cache_file, {
+            'version': _CACHE_VERSION,
+            'mtime': mtime,
+            'installed': sorted(installed_set),
+        })
+
+    return installed_set
+
+
+def _dpkg_journal_pending() -> bool:
+    """Check whether dpkg has changes in its journal (updates/) not yet merged
+    into the status database.
+
+    Returns:
+        True if the journal has entries or can't be read
+    """
+    try:
+        return bool(os.listdir(os.path.join(os.path.dirname(DPKG_STATUS_FILE), 'updates')))
+    except OSError:
+        return True
+
+
+def _read_dpkg_status_file() -> Optional[set]:
+    """Read the installed packages straight from the dpkg status database.
+
+    Avoids spawning dpkg-query, which parses the same file. dpkg keeps
+    not-yet-merged changes in a journal next to it (updates/); if that is
+    not empty the file alone is not authoritative and None is returned, so
+    the caller falls back to dpkg-query.
+
+    Returns:
+        Set of installed package names, or None if the file can't be used
+    """
+    if _dpkg_journal_pending():
+        return None
+    try:
+        with open(DPKG_STATUS_FILE, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    installed_set = set()
+    # One stanza per package; Package and Status are the first two fields
+    for stanza in data.split(b'\n\n'):
+        name = status = None
+        for line in stanza.split(b'\n', 4)[:4]:
+            if line.startswith(b'Package: '):
+                name = line[9:]
+            elif line.startswith(b'Status: '):
+                status = line[8:]
+        # Status is "<want> <error flag> <state>"
+        if name and status and status.endswith(b' installed'):
+            installed_set.add(name.strip().decode())
+    return installed_set
+
+
+@lru_cache(maxsize=None)
+def read_package_list(package_file: str) -> Tuple[str, ...]:
+    """Read a system package list file.
+
+    Memoized: profiles sharing a package list, or a dry run followed by the
+    check of the same profile, read it only once per run.
 
     Args:
         package_file: Path to file containing package names (one per line)
 
     Returns:
-        Tuple of (installed_packages, missing_packages)
+        Tuple of package names in file order, without empty lines, comments
+        and duplicates
     """
-    if not Path(package_file).exists():
-        print_error(f"Package list file not found: {package_file}")
-        return [], []
-
-    # Read package list
-    packages = []
+    packages = {}
     with open(package_file, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
             # Skip empty lines and comments
             if line and not line.startswith('#'):
-                packages.append(line)
+                packages[line] = None
+    return tuple(packages)
+
+
+def check_system_packages_linux(package_file: str,
+                                installed_set: Optional[set] = None) -> Tuple[List[str], List[str]]:
+    """Check which Linux system packages (APT/DEB) are installed.
+
+    Uses dpkg-query to check package status on Debian/Ubuntu systems. The
+    installed package set is cached between runs (see get_installed_dpkg_packages).
+
+    Args:
+        package_file: Path to file containing package names (one per line)
+        installed_set: Installed package names if already queried (e.g. in
+            the background); queried on demand if None
+
+    Returns:
+        Tuple of (installed_packages, missing_packages)
+    """
+    if not _path_exists(package_file):
+        print_error(f"Package list file not found: {package_file}")
+        return [], []
+
+    packages = read_package_list(package_file)
 
     if not packages:
         return [], []
 
     print_info(f"Checking {len(packages)} APT/DEB system packages...")
 
-    # Check all packages at once for better performance
-    result = subprocess.run(
-        ['dpkg-query', '-W', '-f=${Package} ${Status}\n'] + packages,
-        capture_output=True,
-        text=True
-    )
+    if installed_set is None:
+        installed_set = get_installed_dpkg_packages()
 
-    installed = []
-    missing = []
+    # Common case on re-runs: everything is installed, a single C-level subset test
+    if installed_set.issuperset(packages):
+        return list(packages), []
 
-    # Parse output to determine installed vs missing
-    installed_set = set()
-    for line in result.stdout.splitlines():
-        parts = line.split()
-        if len(parts) >= 4 and parts[-3:] == ['install', 'ok', 'installed']:
-            installed_set.add(parts[0])
-
-    for package in packages:
-        if package in installed_set:
-            installed.append(package)
-        else:
-            missing.append(package)
+    # Keep the file order so the suggested apt command matches the package list
+    missing_set = set(packages) - installed_set
+    installed = [p for p in packages if p not in missing_set]
+    missing = [p for p in packages if p in missing_set]
 
     return installed, missing
 
 
-def check_system_requirements(profile: Dict) -> Tuple[List[str], List[str]]:
+def check_system_requirements(profile: Dict,
+                              installed_set: Optional[set] = None) -> Tuple[List[str], List[str]]:
     """Check system requirements (APT/DEB packages).
 
     Args:
         profile: Profile configuration dictionary
+        installed_set: Installed package names if already queried, else None
 
     Returns:
         Tuple of (installed, missing)
@@ -291,100 +747,459 @@ def check_system_requirements(profile: Dict) -> Tuple[List[str], List[str]]:
     if not req_file:
         print_warning("No system requirements file specified")
         return [], []
-    return check_system_packages_linux(req_file)
+    return check_system_packages_linux(req_file, installed_set)
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, unlinking files in parallel.
+
+    A venv holds thousands of small files; unlinking them from a thread pool
+    is considerably faster than shutil.rmtree's sequential walk, especially
+    on network filesystems. Directories are removed bottom-up afterwards.
+    Falls back to shutil.rmtree if anything goes wrong.
+
+    Args:
+        path: Directory to remove
+    """
+    import shutil
+
+    files: List[str] = []
+    dirs: List[str] = []
+    # topdown=False yields leaf directories first, so dirs is in removal order
+    for dirpath, dirnames, filenames in os.walk(path, topdown=False):
+        files.extend(os.path.join(dirpath, name) for name in filenames)
+        for name in dirnames:
+            full = os.path.join(dirpath, name)
+            # Symlinked directories (e.g. venv/lib64) are unlinked, not descended
+            if os.path.islink(full):
+                files.append(full)
+        dirs.append(dirpath)
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # list() re-raises the first unlink error, if any
+            list(executor.map(os.unlink, files))
+        for dirpath in dirs:
+            os.rmdir(dirpath)
+    except OSError:
+        shutil.rmtree(path)
+
+
+def _discard_venv(venv_path: Path) -> None:
+    """Move a venv out of the way and delete it in the background.
+
+    The rename is instant, so the new venv can be created right away while
+    the old tree (thousands of files) is removed by a detached `rm -rf` in
+    its own session. It neither delays the installer's exit nor dies with
+    it on Ctrl+C; leftovers of an interrupted earlier run are removed as
+    well. Falls back to a worker thread if rm can't be started.
+
+    Args:
+        venv_path: Path to the venv directory to discard
+    """
+    import subprocess
+
+    old_path = venv_path.with_name(f'{venv_path.name}.old.{os.getpid()}')
+    try:
+        os.rename(venv_path, old_path)
+    except OSError:
+        # Rename not possible (e.g. venv is a mount point): delete in place
+        _fast_rmtree(venv_path)
+        return
+
+    stale = [str(p) for p in venv_path.parent.glob(f'{venv_path.name}.old.*') if p.is_dir()]
+
+    try:
+        subprocess.Popen(
+            ['rm', '-rf', '--', *stale],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError:
+        import threading
+
+        def _remove_stale():
+            for path in stale:
+                _fast_rmtree(Path(path))
+
+        threading.Thread(target=_remove_stale, name='discard-venv').start()
+
+
+def _venv_rebuild_reason(venv_path: Path, force: bool) -> Optional[str]:
+    """Decide whether the venv has to be (re)created.
+
+    Args:
+        venv_path: Path to venv directory
+        force: If True, recreate venv even if it exists
+
+    Returns:
+        'rebuild', 'missing', 'corrupted' or 'python-changed', or None if
+        the venv can be used
+    """
+    if not venv_path.exists():
+        return 'missing'
+    if force:
+        return 'rebuild'
+    # A sentinel written after creation replaces scanning the bin directory
+    recorded = _read_venv_sentinel(venv_path)
+    if recorded is not None:
+        return None if recorded == _python_version_tag() else 'python-changed'
+    # Venvs created before the sentinel existed: verify the critical files
+    if not _venv_valid(venv_path):
+        return 'corrupted'
+    return None
+
 
+def _spawn_venv_creation(venv_path: Path, reason: str) -> 'subprocess.Popen':
+    """Discard an unusable venv if needed and start creating a new one.
 
-def setup_venv(force: bool = False) -> Path:
+    Args:
+        venv_path: Path to venv directory
+        reason: Result of _venv_rebuild_reason (not None)
+
+    Returns:
+        The running `python -m venv` process (stderr piped)
+    """
+    import subprocess
+
+    if reason != 'missing':
+        _discard_venv(venv_path)
+    return subprocess.Popen(
+        [sys.executable, '-m', 'venv', str(venv_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+
+def start_venv_setup(force: bool = False) -> Optional[Tuple[str, 'subprocess.Popen']]:
+    """Start creating the venv in the background, without printing anything.
+
+    Lets venv creation overlap with the pre-install scripts (it starts once
+    the system requirements check has passed); setup_venv(pending=...)
+    later waits for it and reports the result, cancel_venv_setup undoes it
+    if the installer stops before.
+
+    Only a missing venv is created early. An existing venv that has to be
+    rebuilt is left alone until the system check and the pre-install
+    scripts have passed, so an aborted run never destroys it (a venv can't
+    be built elsewhere and moved into place: its scripts hardcode its path).
+
+    Args:
+        force: If True, recreate venv even if it exists
+
+    Returns:
+        (reason, process) if a venv is being created, None otherwise
+        (setup_venv then does the work itself)
+    """
+    venv_path = Path('venv')
+    reason = _venv_rebuild_reason(venv_path, force)
+    if reason != 'missing':
+        return None
+    try:
+        return reason, _spawn_venv_creation(venv_path, reason)
+    except OSError:
+        return None
+
+
+def cancel_venv_setup(pending: Optional[Tuple[str, 'subprocess.Popen']]) -> None:
+    """Stop a venv creation started by start_venv_setup and remove its output.
+
+    Called when the installer exits before setup_venv, so an aborted run
+    leaves no half-built venv behind. Only a missing venv is created early,
+    so the directory removed here never held a previous venv.
+
+    Args:
+        pending: Result of start_venv_setup (None does nothing)
+    """
+    if pending is None:
+        return
+    _, proc = pending
+    if proc.poll() is None:
+        proc.terminate()
+    proc.wait()
+    if os.path.lexists('venv'):
+        _fast_rmtree(Path('venv'))
+
+
+def setup_venv(force: bool = False,
+               pending: Optional[Tuple[str, 'subprocess.Popen']] = None) -> Path:
     """Create or verify venv exists.
 
     Args:
         force: If True, recreate venv even if it exists
+        pending: Result of start_venv_setup, if creation was started earlier
+
+    Returns:
+        Path to venv directory
+    """
+    venv_path = Path('venv')
+
+    if pending is not None:
+        reason, proc = pending
+    else:
+        reason, proc = _venv_rebuild_reason(venv_path, force), None
+
+    if reason is None:
+        print_info("Virtual environment already exists")
+        return venv_path
+
+    if reason == 'rebuild':
+        print_info("Removing existing venv...")
+        print_info("Creating virtual environment...")
+    elif reason == 'corrupted':
+        print_warning("Virtual environment exists but appears corrupted")
+        print_info("Recreating virtual environment...")
+    elif reason == 'python-changed':
+        print_warning(f"Virtual environment was built with a different Python version "
+                      f"(now {_python_version_tag()})")
+        print_info("Recreating virtual environment...")
+    else:
+        print_info("Creating virtual environment...")
+    sys.stdout.flush()
+
+    try:
+        if proc is None:
+            proc = _spawn_venv_creation(venv_path, reason)
+        _, stderr = proc.communicate()
+    except Exception as e:
+        print_error(f"Unexpected error creating virtual environment: {e}")
+        sys.exit(1)
+
+    if proc.returncode != 0:
+        print_error("Failed to create virtual environment")
+        if stderr:
+            print_error(f"Error: {stderr.decode(errors='replace')}")
+        sys.exit(1)
+
+    _write_venv_sentinel(venv_path)
+    print_success("Virtual environment created")
+    return venv_path
+
+
+def _normalize_package_name(name: str) -> str:
+    """Normalize a package name for comparison (PEP 503)."""
+    return name.lower().replace('_', '-').replace('.', '-')
+
+
+def requirement_names(requirements_file: str) -> set:
+    """Read the normalized package names listed in a requirements file.
+
+    Comments, blank lines and option lines (-r, --index-url, ...) are
+    skipped; version specifiers, extras and markers are cut off.
+
+    Args:
+        requirements_file: Path to requirements file
+
+    Returns:
+        Set of normalized package names
+    """
+    names = set()
+    with open(requirements_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line or line.startswith('-'):
+                continue
+            end = 0
+            while end < len(line) and (line[end].isalnum() or line[end] in '._-'):
+                end += 1
+            if end:
+                names.add(_normalize_package_name(line[:end]))
+    return names
+
+
+def check_package_updates(venv_path: Path, requirements_file: str) -> Dict[str, str]:
+    """Check for available package updates.
+
+    Lists outdated packages with `pip list --outdated` (an index query, no
+    downloads or builds) and keeps those named in the requirements file -
+    the packages `pip install --upgrade` in --update-python upgrades.
+
+    Args:
+        venv_path: Path to virtual environment
+        requirements_file: Path to requirements file
+
+    Returns:
+        Dict mapping package names to available versions
+    """
+    import subprocess
+
+    if not os.path.isfile(requirements_file):
+        print_error(f"Requirements file not found: {requirements_file}")
+        return {}
+
+    pip_exe, python_exe = get_venv_paths(venv_path)
+
+    if not _venv_valid(venv_path):
+        print_error(f"pip/python not found in {pip_exe.parent}")
+        return {}
+
+    print_info("Checking for package updates...")
+    sys.stdout.flush()
+
+    result = subprocess.run(
+        [str(python_exe), '-m', 'pip', 'list', '--outdated', '--format=json',
+         '--disable-pip-version-check'],
+        capture_output=True
+    )
+
+    if result.returncode != 0:
+        print_error("Failed to check for updates")
+        return {}
+
+    try:
+        # json.loads detects the encoding of raw bytes; no separate decode pass
+        outdated = json.loads(result.stdout)
+        wanted = requirement_names(requirements_file)
+        return {pkg['name']: pkg['latest_version'] for pkg in outdated
+                if _normalize_package_name(pkg['name']) in wanted}
+    except Exception:
+        return {}
+
+
+def pip_install_options() -> List[str]:
+    """Options shared by all `pip install` runs.
+
+    --prefer-binary picks a wheel over a newer sdist, so pip does not build
+    packages from source when a wheel exists. Byte-compiling is skipped and
+    done in the background afterwards (see precompile_in_background). Set
+    QUICKSTRAP_PIP_COMPILE=1 to precompile during install.
+
+    Returns:
+        List of pip install options
+    """
+    options = ['--prefer-binary']
+    if not os.environ.get('QUICKSTRAP_PIP_COMPILE'):
+        options.append('--no-compile')
+    return options
+
+
+def locked_requirements(requirements_file: str) -> Optional[str]:
+    """Find the hash-pinned lock file for a requirements file.
+
+    The lock sits next to the requirements file with a .lock suffix
+    (requirements_python_cpu.txt -> requirements_python_cpu.lock.txt) and is
+    generated with `pip-compile --generate-hashes`. Since it already lists
+    every dependency, pinned and hashed, pip can install it with
+    --require-hashes --no-deps and skip dependency resolution entirely.
+
+    Args:
+        requirements_file: Path to requirements file
+
+    Returns:
+        Path to the lock file, or None if there is none
+    """
+    base, ext = os.path.splitext(requirements_file)
+    lock_file = f"{base}.lock{ext}"
+    return lock_file if _path_exists(lock_file) else None
+
+
+def precompile_in_background(venv_path: Path) -> None:
+    """Byte-compile the venv's packages in a detached background process.
+
+    pip runs with --no-compile (see pip_install_options), so this moves the
+    compile step off the install's critical path: it continues after the
+    installer exits, and the app's first start no longer has to compile
+    every module it imports. Call it only after the post-install scripts,
+    which may pip-install into the same venv. Does nothing when pip already
+    compiled (QUICKSTRAP_PIP_COMPILE).
+
+    Args:
+        venv_path: Path to virtual environment
+    """
+    import subprocess
+
+    if os.environ.get('QUICKSTRAP_PIP_COMPILE'):
+        return
+
+    _, python_exe = get_venv_paths(venv_path)
+    try:
+        subprocess.Popen(
+            [str(python_exe), '-m', 'compileall', '-q', '-j', '0', str(venv_path / 'lib')],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except OSError:
+        # Not fatal: modules are still compiled lazily on first import
+        pass
+
+
+# Shared install.log handle, opened on first use (see _log)
+_log_fh = None
 
-    Returns:
-        Path to venv directory
-    """
-    venv_path = Path('venv')
 
-    if force and venv_path.exists():
-        print_info("Removing existing venv...")
-        shutil.rmtree(venv_path)
+def _log():
+    """Return the shared install.log handle, opening it on first use.
 
-    def _create_venv():
-        """Create a new virtual environment, exit on failure."""
-        try:
-            subprocess.run(
-                [sys.executable, '-m', 'venv', 'venv'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            print_success("Virtual environment created")
-        except subprocess.CalledProcessError as e:
-            print_error("Failed to create virtual environment")
-            if e.stderr:
-                print_error(f"Error: {e.stderr}")
-            sys.exit(1)
-        except Exception as e:
-            print_error(f"Unexpected error creating virtual environment: {e}")
-            sys.exit(1)
+    The log is opened once per run (read/append, so failed pip output can be
+    read back) and closed at exit.
+    """
+    global _log_fh
+    if _log_fh is None:
+        import atexit
 
-    if not venv_path.exists():
-        print_info("Creating virtual environment...")
-        _create_venv()
-    else:
-        # Verify the venv is valid by checking for critical files
-        pip_exe, python_exe = get_venv_paths(venv_path)
-
-        if not pip_exe.exists() or not python_exe.exists():
-            print_warning("Virtual environment exists but appears corrupted")
-            print_info("Recreating virtual environment...")
-            shutil.rmtree(venv_path)
-            _create_venv()
-        else:
-            print_info("Virtual environment already exists")
+        _log_fh = open('install.log', 'a+', encoding='utf-8', errors='replace')
+        atexit.register(_log_fh.close)
+    return _log_fh
 
-    return venv_path
 
+def run_pip_logged(pip_args: List[str], python_exe: Path, log_title: str,
+                   requirements_file: str, tail_lines: int = 10) -> Tuple[int, List[str]]:
+    """Run pip with its output streamed straight into install.log.
 
-def check_package_updates(venv_path: Path, requirements_file: str) -> Dict[str, str]:
-    """Check for available package updates.
+    pip is run as `python -m pip` with the venv interpreter, which avoids
+    the extra process spawned by the venv's pip shim. pip writes to the log
+    file descriptor directly, so the output is never buffered in memory and
+    can be followed live with `tail -f install.log`.
 
     Args:
-        venv_path: Path to virtual environment
-        requirements_file: Path to requirements file
+        pip_args: pip arguments (without the pip executable)
+        python_exe: Path to the venv python executable
+        log_title: Title of the log section (e.g. 'Installation log')
+        requirements_file: Requirements file, recorded in the log header
+        tail_lines: Number of trailing output lines to return on failure
 
     Returns:
-        Dict mapping package names to available versions
+        Tuple of (returncode, tail). tail holds the last lines of pip's
+        output read back from the log if pip failed, and is empty on success.
     """
-    if not Path(requirements_file).exists():
-        print_error(f"Requirements file not found: {requirements_file}")
-        return {}
+    import subprocess
+    from collections import deque
+    from datetime import datetime
+
+    log_fh = _log()
+    log_fh.write(f"\n{'=' * 70}\n")
+    log_fh.write(f"{log_title}: {datetime.now().isoformat()}\n")
+    log_fh.write(f"Requirements: {requirements_file}\n")
+    log_fh.write(f"{'=' * 70}\n")
+    log_fh.flush()
+    start = log_fh.tell()
+    sys.stdout.flush()
 
-    pip_exe, _ = get_venv_paths(venv_path)
-
-    if not pip_exe.exists():
-        print_error(f"pip not found at {pip_exe}")
-        return {}
-
-    print_info("Checking for package updates...")
-
-    # Get list of outdated packages
     result = subprocess.run(
-        [str(pip_exe), 'list', '--outdated', '--format=json'],
-        capture_output=True,
-        text=True
+        [str(python_exe), '-m', 'pip', *pip_args,
+         '--no-input', '--disable-pip-version-check', '--require-virtualenv'],
+        stdout=log_fh,
+        stderr=subprocess.STDOUT
     )
 
+    # Make sure the log survives a crash right after a long pip run
+    log_fh.flush()
+    os.fsync(log_fh.fileno())
+
+    tail: List[str] = []
     if result.returncode != 0:
-        print_error("Failed to check for updates")
-        return {}
+        # Only the last lines are kept, however much pip wrote
+        log_fh.seek(start)
+        tail = [line.rstrip('\n') for line in deque(log_fh, maxlen=tail_lines)]
+    # Back to the end; pip appended past our buffered position
+    log_fh.seek(0, os.SEEK_END)
 
-    try:
-        import json
-        outdated = json.loads(result.stdout)
-        return {pkg['name']: pkg['latest_version'] for pkg in outdated}
-    except Exception:
-        return {}
+    return result.returncode, tail
 
 
 def update_python_packages(venv_path: Path, requirements_file: str) -> bool:
@@ -397,14 +1212,14 @@ def update_python_packages(venv_path: Path, requirements_file: str) -> bool:
     Returns:
         True if successful
     """
-    if not Path(requirements_file).exists():
+    if not os.path.isfile(requirements_file):
         print_error(f"Requirements file not found: {requirements_file}")
         return False
 
-    pip_exe, _ = get_venv_paths(venv_path)
+    pip_exe, python_exe = get_venv_paths(venv_path)
 
-    if not pip_exe.exists():
-        print_error(f"pip not found at {pip_exe}")
+    if not _venv_valid(venv_path):
+        print_error(f"pip/python not found in {pip_exe.parent}")
         print_error("Virtual environment may be corrupted")
         print_info("Try running with --rebuild-venv flag to recreate it")
         return False
@@ -412,31 +1227,60 @@ def update_python_packages(venv_path: Path, requirements_file: str) -> bool:
     print_info(f"Updating Python packages from {requirements_file}...")
     print_info("This may take several minutes...")
 
-    # Upgrade packages
-    result = subprocess.run(
-        [str(pip_exe), 'install', '--upgrade', '-r', requirements_file],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True
+    # Upgrade packages (full output goes to the log)
+    returncode, _ = run_pip_logged(
+        ['install', '--upgrade', *pip_install_options(), '-r', requirements_file],
+        python_exe, 'Update log', requirements_file
     )
 
-    # Write full output to log
-    with open('install.log', 'a') as f:
-        f.write(f"\n{'=' * 70}\n")
-        f.write(f"Update log: {datetime.now().isoformat()}\n")
-        f.write(f"Requirements: {requirements_file}\n")
-        f.write(f"{'=' * 70}\n")
-        f.write(result.stdout)
-
-    if result.returncode != 0:
+    if returncode != 0:
         print_error("Failed to update Python packages")
         print_info("Check install.log for details")
         return False
 
     print_success("Python packages updated successfully")
+    precompile_in_background(venv_path)
     return True
 
 
+def requirements_hash(requirements_file: str) -> str:
+    """Hash a requirements file together with the running Python version.
+
+    A lock file next to the requirements file (see locked_requirements) is
+    hashed too, so regenerating the lock triggers a reinstall.
+
+    Args:
+        requirements_file: Path to requirements file
+
+    Returns:
+        Hex digest identifying this exact set of requirements
+    """
+    digest = hashlib.sha256(Path(requirements_file).read_bytes())
+    lock_file = locked_requirements(requirements_file)
+    if lock_file:
+        digest.update(Path(lock_file).read_bytes())
+    digest.update(sys.version.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def venv_fingerprint(venv_path: Path) -> str:
+    """Fingerprint a virtual environment by its pyvenv.cfg mtime.
+
+    pyvenv.cfg is rewritten whenever the venv is (re)created, so the
+    fingerprint changes on --rebuild-venv or a recreated corrupted venv.
+
+    Args:
+        venv_path: Path to virtual environment
+
+    Returns:
+        Fingerprint string (empty if pyvenv.cfg is missing)
+    """
+    try:
+        return str(os.stat(venv_path / 'pyvenv.cfg').st_mtime_ns)
+    except OSError:
+        return ''
+
+
 def install_python_packages(venv_path: Path, requirements_file: str) -> bool:
     """Install Python packages from requirements file.
 
@@ -447,52 +1291,50 @@ def install_python_packages(venv_path: Path, requirements_file: str) -> bool:
     Returns:
         True if successful
     """
+    import subprocess
+
     if not requirements_file:
         print_error("No Python requirements file specified for this platform")
         return False
 
-    if not Path(requirements_file).exists():
+    if not os.path.isfile(requirements_file):
         print_error(f"Requirements file not found: {requirements_file}")
         return False
 
-    pip_exe, _ = get_venv_paths(venv_path)
+    pip_exe, python_exe = get_venv_paths(venv_path)
 
-    # Verify pip executable exists
-    if not pip_exe.exists():
-        print_error(f"pip not found at {pip_exe}")
+    # Verify pip and python executables exist (single scan of venv/bin)
+    if not _venv_valid(venv_path):
+        print_error(f"pip/python not found in {pip_exe.parent}")
         print_error("Virtual environment may be corrupted")
         print_info("Try running with --rebuild-venv flag to recreate it")
         return False
 
+    # A hash-pinned lock file is installed as-is, without running the resolver
+    lock_file = locked_requirements(requirements_file)
+    if lock_file:
+        requirements_file = lock_file
+        pip_args = ['install', *pip_install_options(), '--require-hashes', '--no-deps',
+                    '-r', requirements_file]
+    else:
+        pip_args = ['install', *pip_install_options(), '-r', requirements_file]
+
     print_info(f"Installing Python packages from {requirements_file}...")
     print_info("This may take several minutes...")
 
     try:
-        # Run pip with progress
-        result = subprocess.run(
-            [str(pip_exe), 'install', '-r', requirements_file],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
+        # Run pip (full output goes to the log)
+        returncode, tail = run_pip_logged(
+            pip_args, python_exe, 'Installation log', requirements_file
         )
 
-        # Write full output to log
-        output = result.stdout or ""
-        with open('install.log', 'a', encoding='utf-8') as f:
-            f.write(f"\n{'=' * 70}\n")
-            f.write(f"Installation log: {datetime.now().isoformat()}\n")
-            f.write(f"Requirements: {requirements_file}\n")
-            f.write(f"{'=' * 70}\n")
-            f.write(output)
-
-        if result.returncode != 0:
+        if returncode != 0:
             print_error("Failed to install Python packages")
             print_info("Check install.log for details")
             # Also print last few lines of output for immediate feedback
-            if output:
-                lines = output.strip().split('\n')
+            if tail:
                 print_error("Last output lines:")
-                for line in lines[-10:]:
+                for line in tail:
                     print(f"  {line}")
             return False
 
@@ -501,7 +1343,7 @@ def install_python_packages(venv_path: Path, requirements_file: str) -> bool:
         # Generate frozen requirements for reproducibility
         try:
             freeze_result = subprocess.run(
-                [str(pip_exe), 'freeze'],
+                [str(python_exe), '-m', 'pip', 'freeze', '--disable-pip-version-check'],
                 capture_output=True,
                 text=True
             )
@@ -521,75 +1363,126 @@ def install_python_packages(venv_path: Path, requirements_file: str) -> bool:
         return False
 
 
-def validate_profile_files(profile: Dict) -> List[str]:
-    """Validate that all files referenced in the profile exist.
+@lru_cache(maxsize=None)
+def split_script_list(scripts: Optional[str]) -> Tuple[str, ...]:
+    """Split a comma-separated script list setting into script paths.
 
-    Checks both platform-specific and generic file references.
+    Memoized, so a list that is validated and later run is parsed once.
+
+    Args:
+        scripts: Comma-separated list of script paths (may be empty or None)
+
+    Returns:
+        Tuple of script paths, without empty entries
+    """
+    if not scripts:
+        return ()
+    return tuple(s for s in (part.strip() for part in scripts.split(',')) if s)
+
+
+def profile_file_references(profile: Dict) -> List[Tuple[str, str]]:
+    """List all files referenced by a profile.
 
     Args:
         profile: Profile configuration dict
 
     Returns:
-        List of missing files with their context (empty if all files exist)
+        List of (path, context) tuples, e.g.
+        ('quickstrap/scripts/setup.sh', 'post_install_scripts_linux')
     """
-    missing = []
-    platform = get_platform_name()
+    references = []
 
-    # Check python requirements (platform-specific or generic)
     python_req = resolve_platform_config(profile, 'python_requirements')
-    if python_req and not Path(python_req).exists():
-        missing.append(f"{python_req} (python_requirements)")
-    elif not python_req:
-        # No python requirements found at all
-        missing.append(f"python_requirements_{platform} or python_requirements (not specified)")
+    if python_req:
+        references.append((python_req, 'python_requirements'))
 
-    # Check system requirements
     sys_req = resolve_platform_config(profile, 'system_requirements')
-    if sys_req and not Path(sys_req).exists():
-        missing.append(f"{sys_req} (system_requirements)")
+    if sys_req:
+        references.append((sys_req, 'system_requirements'))
+
+    # Script lists (platform-specific, comma-separated)
+    for key in ('post_install_scripts', 'pre_install_scripts', 'uninstall_scripts'):
+        context = PLATFORM_KEYS[key]
+        references.extend(
+            (script, context)
+            for script in split_script_list(resolve_platform_config(profile, key))
+        )
 
-    # Check post_install_scripts (platform-specific)
-    scripts = resolve_platform_config(profile, 'post_install_scripts')
-    if scripts:
-        script_list = [s.strip() for s in scripts.split(',') if s.strip()]
-        for script_path in script_list:
-            if not Path(script_path).exists():
-                missing.append(f"{script_path} (post_install_scripts_{platform})")
+    return references
 
-    # Check pre_install_scripts (platform-specific)
-    scripts_pre = resolve_platform_config(profile, 'pre_install_scripts')
-    if scripts_pre:
-        script_list = [s.strip() for s in scripts_pre.split(',') if s.strip()]
-        for script_path in script_list:
-            if not Path(script_path).exists():
-                missing.append(f"{script_path} (pre_install_scripts_{platform})")
-
-    # Check uninstall_scripts (platform-specific)
-    scripts_uninstall = resolve_platform_config(profile, 'uninstall_scripts')
-    if scripts_uninstall:
-        script_list = [s.strip() for s in scripts_uninstall.split(',') if s.strip()]
-        for script_path in script_list:
-            if not Path(script_path).exists():
-                missing.append(f"{script_path} (uninstall_scripts_{platform})")
+
+def prefetch_path_exists(paths) -> None:
+    """Check many paths for existence concurrently.
+
+    Lists the distinct parent directories of the paths from a thread pool,
+    warming the _dir_entries cache behind _path_exists. The existence checks
+    then cost about one filesystem round-trip instead of one per file, which
+    matters on network filesystems.
+
+    Args:
+        paths: Iterable of file paths
+    """
+    directories = {os.path.dirname(os.path.normpath(p)) or '.' for p in paths}
+    if len(directories) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(directories), 16)) as executor:
+        list(executor.map(_dir_entries, directories))
+
+
+def validate_profile_files(profile: Dict,
+                           references: Optional[List[Tuple[str, str]]] = None) -> List[str]:
+    """Validate that all files referenced in the profile exist.
+
+    Checks both platform-specific and generic file references.
+
+    Args:
+        profile: Profile configuration dict
+        references: Result of profile_file_references(profile), if the
+            caller already computed it
+
+    Returns:
+        List of missing files with their context (empty if all files exist)
+    """
+    missing = []
+
+    if not resolve_platform_config(profile, 'python_requirements'):
+        # No python requirements found at all
+        missing.append(f"{PLATFORM_KEYS['python_requirements']} or python_requirements (not specified)")
+
+    if references is None:
+        references = profile_file_references(profile)
+    missing.extend(
+        f"{path} ({context})"
+        for path, context in references
+        if not _path_exists(path)
+    )
 
     return missing
 
 
-def run_bash_script(script_path: str, env: Optional[Dict] = None) -> subprocess.CompletedProcess:
+def run_bash_script(script_path: str, env: Optional[Dict] = None,
+                    capture: bool = False) -> 'subprocess.CompletedProcess':
     """Run a bash script.
 
+    By default the script writes straight to the terminal, so its output
+    appears as it is produced and is never held in memory.
+
     Args:
         script_path: Path to the bash script to run
         env: Optional environment variables for the script
+        capture: Capture stdout/stderr (as text) instead of streaming them
 
     Returns:
-        CompletedProcess result
+        CompletedProcess result (stdout/stderr are None unless captured)
     """
+    import subprocess
+
+    sys.stdout.flush()
     return subprocess.run(
         ['bash', script_path],
         env=env,
-        capture_output=True,
-        text=True
+        capture_output=capture,
+        text=capture
     )
 
 
@@ -608,13 +1501,15 @@ def build_script_env(venv_path: Path, app_name: str) -> Dict[str, str]:
     Returns:
         Environment dictionary for subprocess execution
     """
-    env = os.environ.copy()
-    env['VIRTUAL_ENV'] = str(venv_path)
     pip_exe, _ = get_venv_paths(venv_path)
-    env['PATH'] = f"{pip_exe.parent}:{env['PATH']}"
-    env['QUICKSTRAP_APP_NAME'] = app_name
-    env['QUICKSTRAP_CONFIG_DIR'] = str(get_config_dir())  # Project directory
-    return env
+    # One copy of os.environ with the overrides applied
+    return dict(
+        os.environ,
+        VIRTUAL_ENV=str(venv_path),
+        PATH=f"{pip_exe.parent}:{os.environ.get('PATH', '')}",
+        QUICKSTRAP_APP_NAME=app_name,
+        QUICKSTRAP_CONFIG_DIR=str(get_config_dir()),  # Project directory
+    )
 
 
 def state_file_path(app_name: str) -> Path:
@@ -657,27 +1552,26 @@ def run_lifecycle_scripts(scripts: str, venv_path: Path, app_name: str,
         Tuple of (success, failed_scripts). success is False if any script
         failed. failed_scripts lists the paths that failed.
     """
-    script_list = [s.strip() for s in scripts.split(',') if s.strip()]
-    env = build_script_env(venv_path, app_name)
-    env['QUICKSTRAP_STATE_FILE'] = str(state_file_path(app_name))
+    script_list = split_script_list(scripts)
+    # Built once, on the first script that actually runs, and shared by all
+    env = None
 
     failed_scripts: List[str] = []
 
     for script_path in script_list:
-        if not Path(script_path).exists():
+        if not os.path.isfile(script_path):
             print_warning(f"Script not found: {script_path}")
             continue
 
+        if env is None:
+            env = build_script_env(venv_path, app_name)
+            env['QUICKSTRAP_STATE_FILE'] = str(state_file_path(app_name))
+
         print_info(f"Running script: {script_path}")
 
+        # Output goes straight to the terminal while the script runs
         result = run_bash_script(script_path, env=env)
 
-        # Display output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
         if result.returncode != 0:
             print_error(f"Script failed: {script_path}")
             failed_scripts.append(script_path)
@@ -687,17 +1581,49 @@ def run_lifecycle_scripts(scripts: str, venv_path: Path, app_name: str,
     return len(failed_scripts) == 0, failed_scripts
 
 
-def run_pre_install_scripts(scripts: str, profile_name: str) -> bool:
+def _run_bash_scripts_concurrently(script_list: List[str]) -> List[Tuple[int, str, str]]:
+    """Run independent bash scripts at the same time.
+
+    Args:
+        script_list: Paths of the scripts to run
+
+    Returns:
+        (returncode, stdout, stderr) per script, in the order of script_list
+    """
+    import asyncio
+
+    async def _one(script_path):
+        proc = await asyncio.create_subprocess_exec(
+            'bash', script_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        out, err = await proc.communicate()
+        return (
+            proc.returncode,
+            out.decode(errors='replace'),
+            err.decode(errors='replace')
+        )
+
+    async def _gather():
+        return await asyncio.gather(*[_one(s) for s in script_list])
+
+    sys.stdout.flush()
+    return asyncio.run(_gather())
+
+
+def run_pre_install_scripts(scripts: str, profile_name: str, parallel: bool = False) -> bool:
     """Run pre-installation scripts.
 
     Args:
         scripts: Comma-separated list of scripts to run
         profile_name: Name of the profile being installed
+        parallel: Run the scripts concurrently (they must not depend on each other)
 
     Returns:
         True if scripts passed or user chose to continue, False to abort
     """
-    script_list = [s.strip() for s in scripts.split(',') if s.strip()]
+    script_list = split_script_list(scripts)
 
     if not script_list:
         return True
@@ -706,22 +1632,37 @@ def run_pre_install_scripts(scripts: str, profile_name: str) -> bool:
 
     failed_scripts = []
 
+    existing = []
     for script_path in script_list:
-        if not Path(script_path).exists():
+        if not os.path.isfile(script_path):
             print_warning(f"Pre-install script not found: {script_path}")
             continue
+        existing.append(script_path)
+
+    if parallel and len(existing) > 1:
+        print_info(f"Running {len(existing)} pre-install scripts in parallel...")
+        results = _run_bash_scripts_concurrently(existing)
+    else:
+        results = None
 
+    for i, script_path in enumerate(existing):
         print_info(f"Running pre-install script: {script_path}")
 
-        result = run_bash_script(script_path)
+        if results is None:
+            # Sequential scripts stream their output directly
+            result = run_bash_script(script_path)
+            returncode, stdout, stderr = result.returncode, None, None
+        else:
+            returncode, stdout, stderr = results[i]
 
-        # Display output
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
+        # Display collected output of concurrent scripts
+        if stdout:
+            print(stdout)
+        if stderr:
+            sys.stdout.flush()
+            print(stderr, file=sys.stderr)
 
-        if result.returncode != 0:
+        if returncode != 0:
             print_error(f"Pre-install script failed: {script_path}")
             failed_scripts.append(script_path)
 
@@ -747,7 +1688,63 @@ def run_pre_install_scripts(scripts: str, profile_name: str) -> bool:
         return True
 
 
-def write_installation_config(profile_name: str, features: str, app_name: str) -> Path:
+def installation_config_path(app_name: str) -> Path:
+    """Compute the installation config path for an app.
+
+    Args:
+        app_name: Application name from metadata
+
+    Returns:
+        Path to the installation config file (may not exist)
+    """
+    # App-specific config filename (lowercase, spaces replaced with underscores)
+    return get_config_dir() / f"{safe_app_name(app_name)}_profile.ini"
+
+
+@lru_cache(maxsize=None)
+def _read_installation_section(config_file: str) -> Dict[str, str]:
+    """Parse the [installation] section of an installation config, once per run.
+
+    The file is consulted by several modes and by the install flow; it is
+    only rewritten by write_installation_config, which clears this cache.
+
+    Args:
+        config_file: Path to the installation config (as string, for hashing)
+
+    Returns:
+        Dict of the recorded installation values (empty if none recorded)
+    """
+    if not os.path.isfile(config_file):
+        return {}
+    return _parse_ini(config_file).get('installation', {})
+
+
+def read_installation_record(app_name: str) -> Dict[str, str]:
+    """Read the [installation] section written by a previous install.
+
+    Args:
+        app_name: Application name (from metadata, used for config filename)
+
+    Returns:
+        Dict of the recorded installation values (empty if none recorded)
+    """
+    return dict(_read_installation_section(str(installation_config_path(app_name))))
+
+
+def get_installed_profile_name(app_name: str) -> Optional[str]:
+    """Look up the profile recorded by a previous install.
+
+    Args:
+        app_name: Application name (from metadata, used for config filename)
+
+    Returns:
+        Name of the installed profile, or None if none is recorded
+    """
+    return _read_installation_section(str(installation_config_path(app_name))).get('profile')
+
+
+def write_installation_config(profile_name: str, features: str, app_name: str,
+                              extra: Optional[Dict[str, str]] = None) -> Path:
     """Write installation config to project directory.
 
     Config file is stored in the project directory with app-specific name,
@@ -757,32 +1754,92 @@ def write_installation_config(profile_name: str, features: str, app_name: str) -
         profile_name: Name of installed profile
         features: Comma-separated feature list
         app_name: Application name (from metadata, used for config filename)
+        extra: Additional keys to record in the [installation] section
 
     Returns:
         Path to the written config file
     """
-    config_dir = get_config_dir()
-    # No need to create directory - we're in the project directory
+    from datetime import datetime
 
-    # App-specific config filename (lowercase, spaces replaced with underscores)
-    config_filename = f"{safe_app_name(app_name)}_profile.ini"
-    config_file = config_dir / config_filename
+    # No need to create directory - we're in the project directory
+    config_file = installation_config_path(app_name)
 
-    config = ConfigParser()
-    config['installation'] = {
+    values = {
         'profile': profile_name,
         'features': features,
         'install_date': datetime.now().isoformat(),
     }
-
-    with open(config_file, 'w', encoding='utf-8') as f:
-        config.write(f)
+    if extra:
+        values.update(extra)
+
+    # Emit the INI text directly; all values are single-line scalars, so the
+    # output matches what ConfigParser.write would produce
+    text = "[installation]\n" + "".join(f"{k} = {v}\n" for k, v in values.items()) + "\n"
+
+    # Write to a temp file and rename, so an interrupted install never leaves
+    # a truncated config behind
+    tmp_file = config_file.with_suffix('.ini.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, config_file)
+    _read_installation_section.cache_clear()
 
     print_success("Installation config written")
 
     return config_file
 
 
+def dry_run_all_profiles(profiles: Dict) -> None:
+    """Show the system requirements status of every profile.
+
+    The package lists are read concurrently and checked against a single
+    dpkg query, so comparing N profiles costs about as much as checking one.
+
+    Args:
+        profiles: Dict of available profiles
+    """
+    print_header("Dry Run - All Profiles")
+
+    req_files = {}
+    missing_files = set()
+    for name, profile in profiles.items():
+        req_file = resolve_platform_config(profile, 'system_requirements')
+        if not req_file:
+            continue
+        if _path_exists(req_file):
+            req_files[name] = req_file
+        else:
+            missing_files.add(name)
+            print_error(f"Package list file not found: {req_file}")
+
+    with ThreadPoolExecutor(max_workers=min(len(req_files), 5) or 1) as executor:
+        installed_future = executor.submit(get_installed_dpkg_packages)
+        # Profiles often share a package list; read each file once
+        list_futures = {req_file: executor.submit(read_package_list, req_file)
+                        for req_file in set(req_files.values())}
+        installed_set = installed_future.result()
+        package_lists = {name: list_futures[req_file].result()
+                         for name, req_file in req_files.items()}
+
+    name_width = max(len('Profile'), *(len(name) for name in profiles))
+    print(f"  {'Profile':<{name_width}}  {'Installed':>9}  Missing")
+    for name in profiles:
+        if name in missing_files:
+            print(f"  {name:<{name_width}}  {'-':>9}  (system requirements file not found)")
+            continue
+        if name not in package_lists:
+            print(f"  {name:<{name_width}}  {'-':>9}  (no system requirements file)")
+            continue
+        packages = package_lists[name]
+        missing = [p for p in packages if p not in installed_set]
+        installed_count = f"{len(packages) - len(missing)}/{len(packages)}"
+        print(f"  {name:<{name_width}}  {installed_count:>9}  {', '.join(missing) or '-'}")
+
+    print("\nDry run complete")
+
+
 def show_profile_menu(profiles: Dict) -> str:
     """Show interactive profile selection menu.
 
@@ -827,18 +1884,18 @@ def run_uninstall(profiles: Dict, metadata: Dict, args) -> None:
         metadata: Global metadata from installation_profiles.ini
         args: Parsed command-line arguments (uses dry_run, yes)
     """
+    import shutil
+
     app_name = metadata.get('app_name', 'Application')
     print_header(f"{app_name} Uninstall")
 
     config_dir = get_config_dir()
-    config_file = config_dir / f'{safe_app_name(app_name)}_profile.ini'
+    config_file = installation_config_path(app_name)
 
     # Determine the installed profile (if the install left a record behind)
     profile = None
     if config_file.exists():
-        config = ConfigParser()
-        config.read(config_file)
-        installed_profile_name = config.get('installation', 'profile', fallback=None)
+        installed_profile_name = get_installed_profile_name(app_name)
         if installed_profile_name and installed_profile_name in profiles:
             profile = profiles[installed_profile_name]
             print_info(f"Installed profile: {profile['name']}")
@@ -851,20 +1908,24 @@ def run_uninstall(profiles: Dict, metadata: Dict, args) -> None:
         print_warning("Installation config not found - performing best-effort cleanup")
         print_info("Uninstall scripts cannot be run without a recorded installation")
 
-    # Collect project-owned files/directories to remove
+    # Collect project-owned files/directories to remove. They all live in
+    # the project directory, so one listing replaces a stat per candidate.
+    present = set(os.listdir(config_dir))
     venv_path = Path('venv')
     local_paths: List[Path] = []
-    if venv_path.exists():
+    if venv_path.name in present:
         local_paths.append(venv_path)
+    # Discarded venvs whose background removal was interrupted (see _discard_venv)
+    stale_prefix = f'{venv_path.name}.old.'
+    local_paths.extend(Path(name) for name in sorted(present) if name.startswith(stale_prefix))
     for name in ('requirements_frozen.txt', 'install.log'):
-        p = config_dir / name
-        if p.exists():
-            local_paths.append(p)
-    if config_file.exists():
+        if name in present:
+            local_paths.append(config_dir / name)
+    if config_file.name in present:
         local_paths.append(config_file)
     # Shared state file written during installation
     state_file = state_file_path(app_name)
-    if state_file.exists():
+    if state_file.name in present:
         local_paths.append(state_file)
 
     # Resolve uninstall scripts and system packages from the profile
@@ -872,22 +1933,20 @@ def run_uninstall(profiles: Dict, metadata: Dict, args) -> None:
     still_installed: List[str] = []
     if profile:
         sys_req = resolve_platform_config(profile, 'system_requirements')
-        if sys_req and Path(sys_req).exists():
+        if sys_req and os.path.isfile(sys_req):
             still_installed, _ = check_system_packages_linux(sys_req)
 
     # Show the plan
     print()
     print_info("The following will be removed:")
     if local_paths:
-        for p in local_paths:
-            print(f"  - {p}")
+        print_items(local_paths)
     else:
         print("  (no project files found)")
     if uninstall_scripts:
         print()
         print_info("Uninstall scripts to run:")
-        for s in [s.strip() for s in uninstall_scripts.split(',') if s.strip()]:
-            print(f"  - {s}")
+        print_items(split_script_list(uninstall_scripts))
 
     # Dry run stops here
     if args.dry_run:
@@ -945,8 +2004,7 @@ def run_uninstall(profiles: Dict, metadata: Dict, args) -> None:
     if failed_scripts:
         print_header("Uninstall Completed with Warnings")
         print_warning("The following uninstall scripts failed:")
-        for s in failed_scripts:
-            print(f"  - {s}")
+        print_items(failed_scripts)
         print_info("You may need to clean up their side effects manually")
     else:
         print_header("Uninstall Complete!")
@@ -955,6 +2013,8 @@ def run_uninstall(profiles: Dict, metadata: Dict, args) -> None:
 
 def parse_framework_version(text: str) -> Optional[str]:
     """Extract QUICKSTRAP_VERSION from the text of an install.py file."""
+    import re
+
     match = re.search(
         r'''^QUICKSTRAP_VERSION\s*=\s*["']([^"']+)["']''', text, re.MULTILINE
     )
@@ -967,10 +2027,13 @@ def fetch_upstream(source: str, dest: Path) -> Path:
     A local path is used in place (no copy); anything else is treated as a git
     URL and shallow-cloned into dest. Raises on failure so the caller can report.
     """
+    import subprocess
+
     local = Path(source).expanduser()
     if local.exists():
         return local
     print_info(f"Cloning {source} ...")
+    sys.stdout.flush()
     subprocess.run(['git', 'clone', '--depth', '1', source, str(dest)], check=True)
     return dest
 
@@ -984,6 +2047,10 @@ def update_framework(args) -> None:
     (skip confirmation). The running install.py may overwrite itself safely - it
     is already loaded into memory.
     """
+    import shutil
+    import subprocess
+    import tempfile
+
     print_header("Quickstrap Framework Update")
     source = args.source or QUICKSTRAP_REPO
 
@@ -1025,8 +2092,7 @@ def update_framework(args) -> None:
 
         print()
         print_info("Framework files to update:")
-        for _, dst in planned:
-            print(f"  - {dst}")
+        print_items(dst for _, dst in planned)
         print_info("Left untouched: installation_profiles.ini, requirements_*, your own scripts/")
 
         if args.dry_run:
@@ -1063,34 +2129,24 @@ def update_framework(args) -> None:
     print_info("Review with 'git diff', then run ./install.py --validate")
 
 
-def main():
-    """Main installation flow"""
-    # Read profiles first to get available choices
-    profiles, metadata = read_profiles()
-
-    if not profiles:
-        print_error("No installation profiles found")
-        sys.exit(1)
-
-    # Validate platform support
-    if not validate_platform_support(metadata):
-        sys.exit(1)
+def build_epilog(example_profile: str) -> str:
+    """Build the usage examples shown at the end of --help.
 
-    # Get app name from metadata or use generic name
-    app_name = metadata.get('app_name', 'Application')
-    # Note: config_dir is no longer used - config is stored in project directory
+    Args:
+        example_profile: Profile name used in the examples
 
-    # Now create parser with dynamic choices
-    parser = argparse.ArgumentParser(
-        description=f'{app_name} Installation Manager',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+    Returns:
+        Epilog text for the argument parser
+    """
+    return f"""
 Examples:
   ./install.py                              # Interactive installation
-  ./install.py --profile {list(profiles.keys())[0] if profiles else 'profile'}   # Install profile directly
+  ./install.py --profile {example_profile}   # Install profile directly
   ./install.py --rebuild-venv               # Rebuild venv, then interactive menu
-  ./install.py --profile {list(profiles.keys())[0] if profiles else 'profile'} --rebuild-venv # Rebuild venv for specific profile
+  ./install.py --profile {example_profile} --rebuild-venv # Rebuild venv for specific profile
+  ./install.py --force-reinstall            # Run pip even if requirements are unchanged
   ./install.py --dry-run                    # Show what would be installed
+  ./install.py --dry-run-all                # Compare system requirements of all profiles
   ./install.py --validate                   # Validate all profiles
   ./install.py --check-update-python        # Check for Python package updates
   ./install.py --update-python              # Update Python packages
@@ -1101,6 +2157,37 @@ Examples:
   ./install.py --update-framework --dry-run # Show which engine files would update
   ./install.py --update-framework           # Update the Quickstrap engine from GitHub
         """
+
+
+def main():
+    """Main installation flow"""
+    # Batch terminal output instead of flushing every line; the print_* helpers
+    # write with precomputed prefixes and flush at phase boundaries (see _PRE_HEADER)
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    import argparse
+
+    # Arguments are parsed before the profiles are read. Only --help needs
+    # them up front (app name, profile choices and the examples epilog);
+    # --version and --update-framework never read them at all.
+    # argparse also accepts abbreviations of --help (e.g. --hel); no other
+    # option starts with --h, so any prefix of it means help
+    help_requested = False
+    for arg in sys.argv[1:]:
+        if arg == '--':
+            break
+        if arg == '-h' or (len(arg) > 2 and '--help'.startswith(arg)):
+            help_requested = True
+            break
+    profiles = metadata = None
+    if help_requested:
+        profiles, metadata = read_profiles()
+        app_name = metadata.get('app_name', 'Application')
+    parser = argparse.ArgumentParser(
+        description=f'{app_name} Installation Manager' if help_requested else None,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=build_epilog(next(iter(profiles), 'profile')) if help_requested else None
     )
     parser.add_argument(
         '--version',
@@ -1110,7 +2197,7 @@ Examples:
     )
     parser.add_argument(
         '--profile',
-        choices=list(profiles.keys()),
+        choices=list(profiles) if help_requested else None,
         help='Profile to install (skips interactive menu)'
     )
     parser.add_argument(
@@ -1118,11 +2205,26 @@ Examples:
         action='store_true',
         help='Rebuild virtual environment from scratch'
     )
+    parser.add_argument(
+        '--force-reinstall',
+        action='store_true',
+        help='Run pip even if the requirements are unchanged since the last install'
+    )
+    parser.add_argument(
+        '--no-parallel',
+        action='store_true',
+        help='Create the virtual environment only after the pre-install scripts ran'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
         help='Show what would be installed without making changes'
     )
+    parser.add_argument(
+        '--dry-run-all',
+        action='store_true',
+        help='Show the system requirements status of all profiles without making changes'
+    )
     parser.add_argument(
         '--validate',
         action='store_true',
@@ -1166,6 +2268,27 @@ Examples:
         update_framework(args)
         return
 
+    # Read profiles (cached, see read_profiles; --rebuild-venv bypasses the cache)
+    profiles, metadata = read_profiles(use_cache=not args.rebuild_venv)
+
+    if not profiles:
+        print_error("No installation profiles found")
+        sys.exit(1)
+
+    if args.profile and args.profile not in profiles:
+        parser.error(
+            f"argument --profile: invalid choice: {args.profile!r} "
+            f"(choose from {', '.join(map(repr, profiles))})"
+        )
+
+    # Validate platform support
+    if not validate_platform_support(metadata):
+        sys.exit(1)
+
+    # Get app name from metadata or use generic name
+    app_name = metadata.get('app_name', 'Application')
+    # Note: config_dir is no longer used - config is stored in project directory
+
     # Uninstall mode
     if args.uninstall:
         run_uninstall(profiles, metadata, args)
@@ -1177,12 +2300,55 @@ Examples:
 
         all_valid = True
 
-        for profile_name, profile in profiles.items():
+        # Resolve the file references of all profiles once and check them
+        # in one concurrent batch
+        references = {name: profile_file_references(profile) for name, profile in profiles.items()}
+        prefetch_path_exists(path for refs in references.values() for path, _ in refs)
+
+        # Values are stripped when the profiles are read, so a plain truthiness
+        # check covers both absent and blank fields
+        required_fields = ('name', 'description', 'features')
+        script_keys = (
+            ('pre_install_scripts', 'pre_install'),
+            ('post_install_scripts', 'post_install'),
+            ('uninstall_scripts', 'uninstall'),
+        )
+
+        def _check_profile_paths(item):
+            """File checks of one profile; runs in a worker thread, prints nothing."""
+            profile_name, profile = item
+            missing_files = validate_profile_files(profile, references[profile_name])
+            has_scripts = False
+            non_executable = []
+            for key, script_type in script_keys:
+                for script_path in split_script_list(profile.get(key)):
+                    has_scripts = True
+                    st = _stat_path(script_path)
+                    if st is not None and stat.S_ISREG(st.st_mode) and not st.st_mode & 0o111:
+                        non_executable.append(f"{script_path} ({script_type})")
+            return missing_files, has_scripts, non_executable
+
+        # Profiles often share scripts: stat each distinct script once up
+        # front, so the per-profile checks below only hit the cache (workers
+        # racing on the same uncached path would each stat it)
+        script_contexts = {PLATFORM_KEYS[key] for key, _ in script_keys}
+        unique_scripts = {
+            path for refs in references.values() for path, context in refs
+            if context in script_contexts
+        }
+
+        # Run the file checks of all profiles concurrently; results are
+        # printed below from the main thread, in profile order
+        with ThreadPoolExecutor(max_workers=min(max(len(profiles), len(unique_scripts)), 16)) as executor:
+            list(executor.map(_stat_path, unique_scripts))
+            path_results = list(executor.map(_check_profile_paths, profiles.items()))
+
+        for (profile_name, profile), (missing_files, has_scripts, non_executable) \
+                in zip(profiles.items(), path_results):
             print_info(f"Validating profile: {profile_name}")
 
             # Check required fields (platform-aware)
-            required_fields = ['name', 'description', 'features']
-            missing_fields = [f for f in required_fields if f not in profile or not profile[f].strip()]
+            missing_fields = [f for f in required_fields if not profile.get(f)]
 
             # Check requirements exist
             python_req = resolve_platform_config(profile, 'python_requirements')
@@ -1200,42 +2366,20 @@ Examples:
                 print_success(f"  Required fields: OK")
 
             # Validate file references
-            missing_files = validate_profile_files(profile)
             if missing_files:
                 print_error(f"  Missing files:")
-                for missing_file in missing_files:
-                    print(f"    - {missing_file}")
+                print_items(missing_files, prefix="    - ")
                 all_valid = False
             else:
                 print_success(f"  File references: OK")
 
             # Check script executability (platform-aware)
-            scripts_to_check = []
-
-            scripts_pre = resolve_platform_config(profile, 'pre_install_scripts')
-            if scripts_pre:
-                scripts_to_check.extend([(s.strip(), 'pre_install') for s in scripts_pre.split(',') if s.strip()])
-
-            scripts_post = resolve_platform_config(profile, 'post_install_scripts')
-            if scripts_post:
-                scripts_to_check.extend([(s.strip(), 'post_install') for s in scripts_post.split(',') if s.strip()])
-
-            scripts_uninstall = resolve_platform_config(profile, 'uninstall_scripts')
-            if scripts_uninstall:
-                scripts_to_check.extend([(s.strip(), 'uninstall') for s in scripts_uninstall.split(',') if s.strip()])
-
-            non_executable = []
-            for script_path, script_type in scripts_to_check:
-                if Path(script_path).exists() and not os.access(script_path, os.X_OK):
-                    non_executable.append(f"{script_path} ({script_type})")
-
             if non_executable:
                 print_warning(f"  Non-executable scripts:")
-                for script in non_executable:
-                    print(f"    - {script}")
+                print_items(non_executable, prefix="    - ")
                 print_info(f"    Fix with: chmod +x <script>")
             else:
-                if scripts_to_check:
+                if has_scripts:
                     print_success(f"  Script executability: OK")
 
             print()
@@ -1244,7 +2388,7 @@ Examples:
         print_info("Validating metadata")
         # Note: config_dir is no longer required as config is stored in project directory
         required_metadata = ['app_name']
-        missing_metadata = [f for f in required_metadata if f not in metadata or not metadata[f].strip()]
+        missing_metadata = [f for f in required_metadata if not metadata.get(f)]
 
         # Check for start_command (platform-specific or generic)
         start_cmd = resolve_platform_config(metadata, 'start_command')
@@ -1281,7 +2425,7 @@ Examples:
             sys.exit(1)
 
         # Determine which profile is installed (config in project directory)
-        config_file = get_config_dir() / f'{safe_app_name(app_name)}_profile.ini'
+        config_file = installation_config_path(app_name)
 
         if not config_file.exists():
             print_error("Installation profile not found")
@@ -1290,9 +2434,7 @@ Examples:
             sys.exit(1)
 
         # Read installed profile
-        config = ConfigParser()
-        config.read(config_file)
-        installed_profile_name = config.get('installation', 'profile', fallback=None)
+        installed_profile_name = get_installed_profile_name(app_name)
 
         if not installed_profile_name or installed_profile_name not in profiles:
             print_error(f"Installed profile '{installed_profile_name}' not found in configuration")
@@ -1312,8 +2454,8 @@ Examples:
         else:
             print_warning(f"Found {len(updates)} package(s) with available updates:")
             print()
-            for pkg_name, new_version in sorted(updates.items()):
-                print(f"  • {pkg_name} → {new_version}")
+            print_items((f"{pkg_name} → {updates[pkg_name]}" for pkg_name in sorted(updates)),
+                        prefix="  • ")
             print()
             print_info("Run './install.py --update-python' to update packages")
 
@@ -1322,7 +2464,7 @@ Examples:
     # Update mode
     if args.update_python:
         # Determine profile to update (config in project directory)
-        config_file = get_config_dir() / f'{safe_app_name(app_name)}_profile.ini'
+        config_file = installation_config_path(app_name)
 
         if not config_file.exists():
             print_error("Installation profile not found")
@@ -1331,9 +2473,7 @@ Examples:
             sys.exit(1)
 
         # Read installed profile
-        config = ConfigParser()
-        config.read(config_file)
-        installed_profile_name = config.get('installation', 'profile', fallback=None)
+        installed_profile_name = get_installed_profile_name(app_name)
 
         if not installed_profile_name or installed_profile_name not in profiles:
             print_error(f"Installed profile '{installed_profile_name}' not found in configuration")
@@ -1366,6 +2506,11 @@ Examples:
 
         return
 
+    # Dry run for all profiles - compare system requirements and exit
+    if args.dry_run_all:
+        dry_run_all_profiles(profiles)
+        return
+
     # Print header
     print_header(f"{app_name} Installation")
 
@@ -1375,9 +2520,6 @@ Examples:
 
     # Select profile
     if args.profile:
-        if args.profile not in profiles:
-            print_error(f"Profile '{args.profile}' not found")
-            sys.exit(1)
         profile_name = args.profile
         print_info(f"Using profile: {profile_name}")
     else:
@@ -1385,19 +2527,28 @@ Examples:
 
     profile = profiles[profile_name]
 
+    # Query dpkg in the background while the profile files are validated;
+    # the result is collected where the system requirements are checked.
+    dpkg_future = None
+    if resolve_platform_config(profile, 'system_requirements'):
+        executor = ThreadPoolExecutor(max_workers=1)
+        dpkg_future = executor.submit(get_installed_dpkg_packages)
+        executor.shutdown(wait=False)
+
     print()
     print_info(f"Selected: {Colors.BOLD}{profile['name']}{Colors.ENDC}")
     print_info(f"Features: {profile['features']}")
     print()
 
     # Validate profile files exist
-    missing_files = validate_profile_files(profile)
+    references = profile_file_references(profile)
+    prefetch_path_exists(path for path, _ in references)
+    missing_files = validate_profile_files(profile, references)
     if missing_files:
         print_error("Profile validation failed!")
         print()
         print_error("Missing files:")
-        for missing_file in missing_files:
-            print(f"  - {missing_file}")
+        print_items(missing_files)
         print()
         print_info("Please check your profile configuration in:")
         print(f"  quickstrap/installation_profiles.ini")
@@ -1417,7 +2568,9 @@ Examples:
         print(f"Features: {profile['features']}")
 
         # Check system packages
-        _, missing_system = check_system_requirements(profile)
+        _, missing_system = check_system_requirements(
+            profile, dpkg_future.result() if dpkg_future else None
+        )
         if missing_system:
             print(f"\nMissing system packages: {', '.join(missing_system)}")
             print(f"Would need to run: sudo apt install {' '.join(missing_system)}")
@@ -1429,15 +2582,16 @@ Examples:
 
     # Check system packages
     print_header("Step 1: System Requirements Check")
-    installed, missing = check_system_requirements(profile)
+    installed, missing = check_system_requirements(
+        profile, dpkg_future.result() if dpkg_future else None
+    )
 
     if installed:
         print_success(f"{len(installed)} system requirement(s) already installed/available")
 
     if missing:
         print_error(f"{len(missing)} system requirement(s) missing:")
-        for item in missing:
-            print(f"  - {item}")
+        print_items(missing)
 
         print()
         print_info("Please install missing system packages with:")
@@ -1451,28 +2605,54 @@ Examples:
     else:
         print_success("All system requirements are met")
 
+    # Create a missing venv in the background while the pre-install scripts
+    # run (python3-venv may be one of the system requirements checked above)
+    venv_pending = None if args.no_parallel else start_venv_setup(force=args.rebuild_venv)
+
     # Run pre-install scripts if defined (platform-specific)
     scripts_pre = resolve_platform_config(profile, 'pre_install_scripts')
     if scripts_pre:
-        should_continue = run_pre_install_scripts(scripts_pre, profile_name)
-        if not should_continue:
-            sys.exit(1)
+        try:
+            parallel = profile.get('pre_install_parallel', '').lower() in ('1', 'true', 'yes', 'on')
+            should_continue = run_pre_install_scripts(scripts_pre, profile_name, parallel=parallel)
+            if not should_continue:
+                sys.exit(1)
+        except (KeyboardInterrupt, SystemExit):
+            # Don't leave a half-built venv behind on abort
+            cancel_venv_setup(venv_pending)
+            raise
         step_offset = 1  # Pre-install scripts used Step 2
     else:
         step_offset = 0  # No pre-install scripts, so venv is Step 2
 
     # Setup virtual environment
     print_header(f"Step {2 + step_offset}: Virtual Environment Setup")
-    venv_path = setup_venv(force=args.rebuild_venv)
+    venv_path = setup_venv(force=args.rebuild_venv, pending=venv_pending)
 
     # Install Python packages (platform-specific)
     print_header(f"Step {3 + step_offset}: Python Package Installation")
     python_req = resolve_platform_config(profile, 'python_requirements', required=True)
-    success = install_python_packages(venv_path, python_req)
 
-    if not success:
-        print_error("Installation failed")
-        sys.exit(1)
+    # Skip pip if the same requirements were already installed into this venv
+    install_record = {}
+    if python_req and _path_exists(python_req):
+        install_record = {
+            'requirements_hash': requirements_hash(python_req),
+            'venv_fingerprint': venv_fingerprint(venv_path),
+        }
+    previous = read_installation_record(app_name)
+    if (install_record and not args.force_reinstall
+            and all(previous.get(k) == v for k, v in install_record.items())):
+        print_success("Requirements unchanged, skipping pip")
+        print_info("Use --force-reinstall to run pip anyway")
+        packages_installed = False
+    else:
+        success = install_python_packages(venv_path, python_req)
+
+        if not success:
+            print_error("Installation failed")
+            sys.exit(1)
+        packages_installed = True
 
     # Run post-install scripts if defined (platform-specific)
     scripts = resolve_platform_config(profile, 'post_install_scripts')
@@ -1487,6 +2667,10 @@ Examples:
 
         print_success("All post-install scripts completed")
 
+    # Byte-compile only now: post-install scripts may still install into the venv
+    if packages_installed:
+        precompile_in_background(venv_path)
+
     # Write installation config
     # Calculate final step number: 1 (sys) + pre_scripts + venv + python + post_scripts + config
     final_step = 4 + step_offset + (1 if scripts else 0)
@@ -1494,7 +2678,8 @@ Examples:
     config_path = write_installation_config(
         profile_name=profile_name,
         features=profile['features'],
-        app_name=app_name
+        app_name=app_name,
+        extra=install_record
     )
 
     # Success!
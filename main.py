@@ -24,13 +24,67 @@ GitHub: https://github.com/Stefan-Schmidbauer/voicesnip
 
 import os
 import sys
-import customtkinter as ctk
-from tkinter import messagebox
-
-from dotenv import load_dotenv
 
 from voicesnip.gui.config_manager import load_installation_config
-from voicesnip.gui.main_window import VoiceSnipGUI
+
+
+# Escape sequences python-dotenv decodes inside double-quoted values
+_ENV_ESCAPES = {'\\': '\\', "'": "'", '"': '"', 'a': '\a', 'b': '\b',
+                'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v'}
+
+
+def _parse_env_value(value):
+    """Parse the value part of a .env line the way python-dotenv does.
+
+    Unquoted values end at an inline comment (whitespace, then '#'). Quoted values end at the
+    closing quote; double quotes decode the usual backslash escapes,
+    single quotes only \\ and \'.
+    """
+    value = value.strip()
+    if not value or value[0] not in '"\'':
+        for i in range(1, len(value)):
+            if value[i] == '#' and value[i - 1] in ' \t':
+                return value[:i].rstrip()
+        return value
+
+    quote = value[0]
+    result = []
+    i = 1
+    while i < len(value):
+        char = value[i]
+        if char == quote:
+            break
+        if char == '\\' and i + 1 < len(value):
+            escaped = value[i + 1]
+            if quote == '"' and escaped in _ENV_ESCAPES:
+                result.append(_ENV_ESCAPES[escaped])
+                i += 2
+                continue
+            if quote == "'" and escaped in "\\'":
+                result.append(escaped)
+                i += 2
+                continue
+        result.append(char)
+        i += 1
+    return ''.join(result)
+
+
+def _load_env(path):
+    """Parse a KEY=VALUE .env file into os.environ.
+
+    Existing environment variables take precedence, as with load_dotenv.
+    Blank lines, comments and an optional 'export ' prefix are handled;
+    values are parsed by _parse_env_value.
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            if line.startswith('export '):
+                line = line[7:]
+            key, value = line.split('=', 1)
+            os.environ.setdefault(key.strip(), _parse_env_value(value))
 
 
 def load_config_file():
@@ -41,11 +95,17 @@ def load_config_file():
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
     config_path = os.path.join(base_dir, '.env')
-    if os.path.exists(config_path):
-        load_dotenv(config_path)
+    try:
+        _load_env(config_path)
         return config_path
+    except FileNotFoundError:
+        pass
 
-    # Fallback: try default load_dotenv behavior (searches parent dirs)
+    # Fallback: search parent dirs with python-dotenv, if it is installed
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return None
     load_dotenv()
     return None
 
@@ -60,8 +120,11 @@ def main():
     config = load_installation_config()
 
     if config is None:
-        # Show error dialog
-        root = ctk.CTk()
+        # Show error dialog (plain Tk; the GUI stack is not loaded yet)
+        import tkinter as tk
+        from tkinter import messagebox
+
+        root = tk.Tk()
         root.withdraw()
         messagebox.showerror(
             "Installation Required",
@@ -72,6 +135,11 @@ def main():
         )
         sys.exit(1)
 
+    # Import the GUI stack (customtkinter, providers, audio) only once the
+    # installation is known to be usable
+    import customtkinter as ctk
+    from voicesnip.gui.main_window import VoiceSnipGUI
+
     # Start GUI with installation config
     root = ctk.CTk()
     app = VoiceSnipGUI(root, installation_config=config)
@@ -6,41 +6,66 @@ Local-execution only: CPU, CUDA and ROCm backends.
 To add a new provider:
 1. Create a new file in this directory (e.g., openai.py)
 2. Implement STTProvider abstract base class
-3. Add a registry entry to PROVIDER_REGISTRY below
+3. Add a registry entry to PROVIDER_REGISTRY below ('class' is a
+   "module:ClassName" path imported on first use; 'fixed_config' holds
+   fixed constructor arguments implied by the key, e.g. the device)
 4. Add the feature to installation_profiles.ini
 """
 
+import importlib
 from typing import List, Dict, Any, Optional
 from .base import STTProvider
-from .whisper import WhisperProvider
-from .whisper_rocm import WhisperROCmProvider
 
 
 # Self-describing provider registry (local execution only)
 PROVIDER_REGISTRY: List[Dict[str, Any]] = [
     {
         'key': 'whisper-local-gpu',
-        'class': WhisperProvider,
+        'class': '.whisper:WhisperProvider',
         'display_name': 'Whisper Local GPU (Free, CUDA)',
         'config_key': 'whisper',
         'features': ['whisper', 'cuda'],
+        'fixed_config': {'device': 'cuda'},
     },
     {
         'key': 'whisper-local-rocm',
-        'class': WhisperROCmProvider,
+        'class': '.whisper_rocm:WhisperROCmProvider',
         'display_name': 'Whisper Local GPU (Free, ROCm)',
         'config_key': 'whisper',
         'features': ['whisper', 'rocm'],
+        'fixed_config': {},
     },
     {
         'key': 'whisper-local-cpu',
-        'class': WhisperProvider,
+        'class': '.whisper:WhisperProvider',
         'display_name': 'Whisper Local CPU (Free)',
         'config_key': 'whisper',
         'features': ['whisper'],
+        'fixed_config': {'device': 'cpu'},
     },
 ]
 
+# Lookup table by provider key, built once from the registry
+_REGISTRY_BY_KEY: Dict[str, Dict[str, Any]] = {entry['key']: entry for entry in PROVIDER_REGISTRY}
+
+
+def _load_class(path: str) -> type:
+    """Import a provider class from its "module:ClassName" registry path.
+
+    Provider modules are only imported once a provider is created, so
+    listing providers does not load any backend.
+    """
+    module_name, class_name = path.split(':')
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def __getattr__(name: str):
+    """Resolve the provider classes exported in __all__ on first access"""
+    for entry in PROVIDER_REGISTRY:
+        if entry['class'].endswith(':' + name):
+            return _load_class(entry['class'])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_providers_for_features(features: List[str]) -> List[Dict[str, Any]]:
     """Return registry entries whose required features are all present in the given feature list.
@@ -67,10 +92,7 @@ def get_registry_entry(key: str) -> Optional[Dict[str, Any]]:
     Returns:
         Registry entry dict or None if not found
     """
-    for entry in PROVIDER_REGISTRY:
-        if entry['key'] == key:
-            return entry
-    return None
+    return _REGISTRY_BY_KEY.get(key)
 
 
 def create_provider(name: str, **config) -> STTProvider:
@@ -87,18 +109,15 @@ def create_provider(name: str, **config) -> STTProvider:
     Raises:
         ValueError: If provider name is unknown
     """
-    entry = get_registry_entry(name.lower())
+    entry = _REGISTRY_BY_KEY.get(name.lower())
     if entry is None:
-        available = ', '.join(e['key'] for e in PROVIDER_REGISTRY)
+        available = ', '.join(_REGISTRY_BY_KEY)
         raise ValueError(f"Unknown provider '{name}'. Available: {available}")
 
-    # Extract device info from provider name for Whisper
-    if name.lower() == 'whisper-local-gpu':
-        config['device'] = 'cuda'
-    elif name.lower() == 'whisper-local-cpu':
-        config['device'] = 'cpu'
+    # Fixed settings implied by the provider key (e.g. the Whisper device)
+    config.update(entry['fixed_config'])
 
-    return entry['class'](**config)
+    return _load_class(entry['class'])(**config)
 
 
 # Export public API
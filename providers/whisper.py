@@ -7,10 +7,42 @@ No API key required, works offline, free to use.
 
 import os
 import io
-from typing import Optional, List
+import time
+import wave
+from typing import Iterator, Optional, List
 from .base import STTProvider
 
 
+def _env_number(name: str, default, cast=float, minimum=None):
+    """
+    Read a numeric setting from the environment.
+
+    An unset or empty variable gives the default; a malformed or too small
+    value is reported and replaced by the default instead of failing.
+
+    Args:
+        name: Environment variable name
+        default: Value to use if the variable is unset or invalid
+        cast: Conversion function (float or int)
+        minimum: Smallest accepted value, or None for no limit
+
+    Returns:
+        The parsed value or the default
+    """
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    # value != value catches NaN
+    if value is None or value != value or (minimum is not None and value < minimum):
+        print(f"Warning: Invalid {name}={raw!r}, using default {default}")
+        return default
+    return value
+
+
 class WhisperProvider(STTProvider):
     """Faster Whisper local STT provider"""
 
@@ -28,13 +60,60 @@ class WhisperProvider(STTProvider):
         self.model_name = model or os.getenv("WHISPER_MODEL", "small")
         self.device = device
         # Auto-select compute type based on device if not specified
+        # (WHISPER_COMPUTE_TYPE overrides, e.g. float16 for GPUs without int8 support)
+        if compute_type == "default":
+            compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "default")
         if compute_type == "default":
             if device == "cuda":
-                compute_type = "float16"  # Use float16 on CUDA for better performance
+                compute_type = "int8_float16"  # int8 weights halve memory traffic on CUDA
             else:
                 compute_type = "int8"  # Use int8 on CPU for better performance
         self.compute_type = compute_type
         self._model = None
+        # HF cache directory name fragment (models--Systran--faster-whisper-{model});
+        # turbo is stored as faster-whisper-large-v3-turbo
+        self._cache_pattern = ("faster-whisper-large-v3-turbo" if self.model_name == "turbo"
+                               else f"faster-whisper-{self.model_name}")
+        self._cache_scan = None  # (monotonic timestamp, result) of the last HF cache scan
+        # Recordings below this RMS level are treated as silence (0 disables the level check)
+        self.silence_rms = _env_number("WHISPER_SILENCE_RMS", 0.005, float, minimum=0.0)
+        # Greedy decoding by default: short dictation clips gain little from beam search
+        self.beam_size = _env_number("WHISPER_BEAM_SIZE", 1, int, minimum=1)
+
+    @staticmethod
+    def _cpu_threads() -> int:
+        """
+        Count the physical cores this process may run on.
+
+        Logical CPUs from the affinity mask are grouped by their core in
+        /sys/devices/system/cpu, so SMT siblings count once and CPUs outside
+        a container's cpuset are ignored.
+
+        Returns:
+            Number of physical cores (logical CPUs if the topology is unknown)
+        """
+        try:
+            cpus = os.sched_getaffinity(0)
+        except AttributeError:
+            cpus = range(os.cpu_count() or 1)
+
+        cores = set()
+        for cpu in cpus:
+            topology = f"/sys/devices/system/cpu/cpu{cpu}/topology/"
+            try:
+                with open(topology + "physical_package_id") as f:
+                    package = f.read().strip()
+                with open(topology + "core_id") as f:
+                    cores.add((package, f.read().strip()))
+            except OSError:
+                return max(1, len(cpus))
+        return max(1, len(cores))
+
+    def _cpu_options(self, device: str) -> dict:
+        """Extra WhisperModel arguments for CPU inference (none on CUDA)"""
+        if device != "cpu":
+            return {}
+        return {'cpu_threads': self._cpu_threads()}
 
     @property
     def name(self) -> str:
@@ -45,21 +124,8 @@ class WhisperProvider(STTProvider):
         """Lazy load model on first use"""
         if self._model is None:
             from faster_whisper import WhisperModel
-            from pathlib import Path
-
-            # Check if model is already downloaded
-            cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-            model_cached = False
-            if cache_dir.exists():
-                # Look for model directory (format: models--Systran--faster-whisper-{model})
-                # Special case: turbo is stored as faster-whisper-large-v3-turbo
-                search_pattern = "faster-whisper-large-v3-turbo" if self.model_name == "turbo" else f"faster-whisper-{self.model_name}"
-                for entry in cache_dir.iterdir():
-                    if search_pattern in entry.name:
-                        model_cached = True
-                        break
-
-            if model_cached:
+
+            if self._scan_hf_cache():
                 print(f"Loading Whisper model '{self.model_name}'...")
             else:
                 print(f"Downloading Whisper model '{self.model_name}'...")
@@ -73,7 +139,8 @@ class WhisperProvider(STTProvider):
                 self._model = WhisperModel(
                     self.model_name,
                     device=device_to_use,
-                    compute_type=compute_type_to_use
+                    compute_type=compute_type_to_use,
+                    **self._cpu_options(device_to_use)
                 )
                 device_info = f"{device_to_use.upper()}"
                 if device_to_use == "cuda":
@@ -95,7 +162,8 @@ class WhisperProvider(STTProvider):
                         self._model = WhisperModel(
                             self.model_name,
                             device=device_to_use,
-                            compute_type=compute_type_to_use
+                            compute_type=compute_type_to_use,
+                            **self._cpu_options(device_to_use)
                         )
                         print(f"Model '{self.model_name}' ready on CPU!")
                         # Update device for future reference
@@ -105,43 +173,50 @@ class WhisperProvider(STTProvider):
                 else:
                     raise ValueError(f"Failed to load model: {e}")
 
+            # The model is in the HF cache now
+            self._cache_scan = (time.monotonic(), True)
+
         return self._model
 
     def unload_model(self) -> None:
         """Unload model from memory/VRAM"""
         if self._model is not None:
             print(f"Unloading Whisper model '{self.model_name}' from {self.device.upper()}...")
+            # The weights live in CTranslate2's allocator, not PyTorch's: release
+            # them explicitly instead of waiting for the last reference to go
+            try:
+                self._model.model.unload_model(to_cpu=False)
+            except AttributeError:
+                pass
             del self._model
             self._model = None
-            # Force garbage collection to free VRAM immediately
+            # Collect leftover references (e.g. from an unfinished segment generator)
             import gc
             gc.collect()
-            # If using CUDA, also clear CUDA cache
-            if self.device == "cuda":
-                try:
-                    import torch
-                    torch.cuda.empty_cache()
-                    print("CUDA cache cleared")
-                except ImportError:
-                    pass
 
-    def is_model_downloaded(self) -> bool:
-        """Check if the Whisper model is already downloaded and cached"""
-        from pathlib import Path
+    def _scan_hf_cache(self) -> bool:
+        """Check the HuggingFace cache for the model directory.
 
-        # Check if model is already downloaded in HuggingFace cache
-        cache_dir = Path.home() / ".cache" / "huggingface" / "hub"
-        if not cache_dir.exists():
-            return False
+        The result is kept for a few seconds so repeated checks (e.g. from
+        the GUI) do not list the cache directory every time.
+        """
+        now = time.monotonic()
+        if self._cache_scan is not None and now - self._cache_scan[0] < 5.0:
+            return self._cache_scan[1]
+
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "huggingface", "hub")
+        try:
+            with os.scandir(cache_dir) as entries:
+                found = any(self._cache_pattern in e.name for e in entries)
+        except OSError:
+            found = False
 
-        # Look for model directory (format: models--Systran--faster-whisper-{model})
-        # Special case: turbo is stored as faster-whisper-large-v3-turbo
-        search_pattern = "faster-whisper-large-v3-turbo" if self.model_name == "turbo" else f"faster-whisper-{self.model_name}"
-        for entry in cache_dir.iterdir():
-            if search_pattern in entry.name:
-                return True
+        self._cache_scan = (now, found)
+        return found
 
-        return False
+    def is_model_downloaded(self) -> bool:
+        """Check if the Whisper model is already downloaded and cached"""
+        return self._scan_hf_cache()
 
     def validate_config(self) -> None:
         """Validate Whisper configuration"""
@@ -162,6 +237,96 @@ class WhisperProvider(STTProvider):
             "turbo",
         ]
 
+    @staticmethod
+    def _decode_wav(audio_bytes: bytes):
+        """
+        Turn WAV bytes into the input for WhisperModel.transcribe.
+
+        16 kHz mono 16-bit audio (what AudioRecorder records by default) is
+        converted straight to a float32 array, so faster-whisper skips its
+        own decoding and resampling. Anything else is handed over as a
+        file-like object and decoded by faster-whisper.
+
+        Args:
+            audio_bytes: WAV format audio data
+
+        Returns:
+            numpy float32 array, or a BytesIO of the original data
+        """
+        import numpy as np
+
+        with wave.open(io.BytesIO(audio_bytes), 'rb') as wav_file:
+            if (wav_file.getframerate() != 16000 or wav_file.getnchannels() != 1
+                    or wav_file.getsampwidth() != 2):
+                return io.BytesIO(audio_bytes)
+            frames = wav_file.readframes(wav_file.getnframes())
+        return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+
+    def _is_silent(self, audio) -> bool:
+        """
+        Check whether 16 kHz audio is too short or too quiet to contain speech.
+
+        Args:
+            audio: float32 samples as returned by _decode_wav
+
+        The level is that of the loudest 30 ms frame, so a short word in an
+        otherwise quiet recording still counts as speech.
+
+        Returns:
+            True if the recording is shorter than 0.2s or no frame reaches silence_rms
+        """
+        import numpy as np
+
+        if len(audio) < 16000 * 0.2:
+            return True
+        if self.silence_rms <= 0:
+            return False
+        frame = 480  # 30 ms at 16 kHz
+        frames = audio[:len(audio) // frame * frame].reshape(-1, frame)
+        return float(np.sqrt(np.square(frames).mean(axis=1).max())) < self.silence_rms
+
+    def transcribe_stream(self, audio_bytes: bytes, language: Optional[str] = None) -> Iterator[str]:
+        """
+        Transcribe audio using Faster Whisper, yielding text segment by segment.
+
+        faster-whisper decodes lazily, so each segment is yielded as soon as it
+        is finished; callers can show partial results of longer recordings.
+
+        Args:
+            audio_bytes: WAV format audio data
+            language: ISO language code ('de', 'en') or None for auto-detect
+
+        Yields:
+            Non-empty segment texts
+        """
+        audio = self._decode_wav(audio_bytes)
+
+        # Skip inference for silence or a key tap (decoded 16 kHz audio only)
+        if not isinstance(audio, io.BytesIO) and self._is_silent(audio):
+            return
+
+        # Tuned for short push-to-talk utterances: VAD drops leading/trailing
+        # silence, and each clip is decoded on its own
+        transcribe_params = {
+            'beam_size': self.beam_size,
+            'vad_filter': True,
+            'vad_parameters': {'min_silence_duration_ms': 300},
+            'condition_on_previous_text': False,
+        }
+        # Transcribe with language hint if provided
+        if language:
+            transcribe_params['language'] = language
+
+        segments, info = self.model.transcribe(
+            audio,
+            **transcribe_params
+        )
+
+        for segment in segments:
+            text = segment.text.strip()
+            if text:
+                yield text
+
     def transcribe(self, audio_bytes: bytes, language: Optional[str] = None) -> Optional[str]:
         """
         Transcribe audio using Faster Whisper.
@@ -174,23 +339,8 @@ class WhisperProvider(STTProvider):
             Transcribed text or None on error
         """
         try:
-            # Create file-like object from bytes
-            audio_buffer = io.BytesIO(audio_bytes)
-
-            # Transcribe with language hint if provided
-            transcribe_params = {}
-            if language:
-                transcribe_params['language'] = language
-
-            segments, info = self.model.transcribe(
-                audio_buffer,
-                **transcribe_params
-            )
-
             # Combine all segments into single transcript
-            transcript_parts = [segment.text for segment in segments]
-            transcript = " ".join(transcript_parts).strip()
-
+            transcript = " ".join(self.transcribe_stream(audio_bytes, language))
             return transcript if transcript else None
 
         except (Exception, SystemError) as e:
@@ -8,7 +8,6 @@ import sys
 import io
 import wave
 import threading
-import numpy as np
 import sounddevice as sd
 
 from .constants import CHANNELS, DTYPE
@@ -21,7 +20,8 @@ class AudioRecorder:
         self.device_id = device_id
         self.sample_rate = sample_rate
         self.is_recording = threading.Event()
-        self.audio_data = []
+        # Raw 16-bit PCM of the current recording, appended to in place
+        self.audio_buf = bytearray()
         self.audio_data_lock = threading.Lock()
         self.stream = None
 
@@ -31,7 +31,7 @@ class AudioRecorder:
             print(f"Audio status: {status}", file=sys.stderr)
         if self.is_recording.is_set():
             with self.audio_data_lock:
-                self.audio_data.append(indata.copy())
+                self.audio_buf += indata
 
     def start_recording(self):
         """Start audio recording
@@ -45,7 +45,7 @@ class AudioRecorder:
 
         self.is_recording.set()
         with self.audio_data_lock:
-            self.audio_data = []
+            self.audio_buf = bytearray()
 
         # Start audio stream with selected device
         stream_params = {
@@ -92,7 +92,7 @@ class AudioRecorder:
 
         # Check if we have audio data
         with self.audio_data_lock:
-            has_audio = len(self.audio_data) > 0
+            has_audio = len(self.audio_buf) > 0
 
         return has_audio
 
@@ -102,22 +102,18 @@ class AudioRecorder:
         Returns:
             bytes: WAV format audio data
         """
-        # Concatenate all audio chunks
+        # Create WAV file in memory straight from the PCM buffer
+        wav_buffer = io.BytesIO()
         with self.audio_data_lock:
-            if not self.audio_data:
+            if not self.audio_buf:
                 raise ValueError("No audio data recorded")
-            audio_array = np.concatenate(self.audio_data, axis=0)
+            with wave.open(wav_buffer, 'wb') as wav_file:
+                wav_file.setnchannels(CHANNELS)
+                wav_file.setsampwidth(2)  # 16-bit = 2 bytes
+                wav_file.setframerate(self.sample_rate)
+                wav_file.writeframes(self.audio_buf)
 
-        # Create WAV file in memory
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, 'wb') as wav_file:
-            wav_file.setnchannels(CHANNELS)
-            wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_array.tobytes())
-
-        wav_buffer.seek(0)
-        return wav_buffer.read()
+        return wav_buffer.getvalue()
 
     def cleanup(self):
         """Clean up audio resources"""
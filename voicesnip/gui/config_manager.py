@@ -50,15 +50,13 @@ def load_installation_config():
     Returns:
         Dict with config data or None if missing
     """
-    # Config file is in project directory with app-specific name
-    if not PROFILE_FILE.exists():
-        return None
-
-    config_file = PROFILE_FILE
-
     try:
+        # Config file is in project directory with app-specific name.
+        # read() skips a missing file and returns the files it did read,
+        # which saves a separate existence check.
         config = ConfigParser()
-        config.read(config_file)
+        if not config.read(PROFILE_FILE, encoding='utf-8'):
+            return None
 
         # Validate required fields
         if 'installation' not in config: